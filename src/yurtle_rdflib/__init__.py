@@ -32,11 +32,16 @@ License: MIT
 """
 
 import logging
+import os
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Union
+from typing import Dict, Optional, List, Tuple, Union
 
 from rdflib import Graph, URIRef, Namespace
 from rdflib.namespace import RDF, RDFS
+from rdflib.term import Node
 
 # Import plugins (registers them with rdflib on import)
 from .parser import YurtleRDFlibParser  # noqa: F401
@@ -52,6 +57,8 @@ from .core import (
     parse_yurtle_file,
     scan_workspace_graph,
 )
+from .core import _collect_workspace_files, _parse_files_into, _real_dir, _real_path, _split_frontmatter
+from .namespaces import _DEFINED_IN
 
 # Re-export namespaces
 from .namespaces import (
@@ -67,6 +74,16 @@ from .namespaces import (
 
 logger = logging.getLogger(__name__)
 
+# (size, mtime_ns, inode) of a file, as it was before being read
+_Fingerprint = Tuple[int, int, int]
+
+# Markdown bodies captured by load_workspace(), per loaded graph: resolved
+# path -> (fingerprint, or None if it can't be trusted; body). Kept here
+# rather than on the Graph, and dropped with the graph.
+_loaded_markdown: "weakref.WeakKeyDictionary[Graph, Dict[Path, Tuple[Optional[_Fingerprint], str]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
 # Version info
 __version__ = "0.1.0"
 __all__ = [
@@ -108,16 +125,24 @@ __all__ = [
 def load_workspace(
     workspace_path: Union[str, Path],
     patterns: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
 ) -> Graph:
     """
     Load all Yurtle files in a workspace into a unified graph.
 
     This scans the workspace directory for .md files, parses each one,
     and combines all triples into a single graph with provenance.
+    With max_workers > 1, files are parsed in worker processes. The markdown
+    body of each file is remembered with the file's stat, so save_workspace()
+    can write it back without re-reading files that haven't changed since.
 
     Args:
         workspace_path: Root directory to scan
         patterns: Glob patterns to match (default: ['**/*.md'])
+        max_workers: Worker processes for parsing (default: None, parse in
+            this process). Values above 1 parse in a process pool, which
+            under spawn/forkserver needs an ``if __name__ == "__main__"``
+            guard in the calling script.
 
     Returns:
         RDFlib Graph containing all triples from workspace
@@ -130,37 +155,35 @@ def load_workspace(
     patterns = patterns or ["**/*.md"]
 
     graph = Graph()
-    parser = YurtleParser()
 
     # Bind standard namespaces
     bind_standard_namespaces(graph)
 
     files_parsed = 0
-    triples_added = 0
-
-    for pattern in patterns:
-        for path in workspace.glob(pattern):
-            if path.is_file() and not path.name.startswith('.'):
-                try:
-                    doc = parser.parse_file(path)
-
-                    # Add all triples from the document
-                    for triple in doc.graph:
-                        graph.add(triple)
-                        triples_added += 1
-
-                    # Add provenance triple
-                    if doc.subject_uri:
-                        file_uri = URIRef(f"file://{path.resolve()}")
-                        graph.add((doc.subject_uri, PROVENANCE.definedIn, file_uri))
-                        triples_added += 1
-
-                    files_parsed += 1
-
-                except Exception as e:
-                    logger.warning(f"Failed to parse {path}: {e}")
-
-    logger.info(f"Loaded workspace: {files_parsed} files, {triples_added} triples")
+    markdown: Dict[Path, Tuple[Optional[_Fingerprint], str]] = {}
+    provenance = []
+
+    # Directory symlinks may have been re-pointed since the last load
+    _real_dir.cache_clear()
+    paths = _collect_workspace_files(workspace, patterns)
+    # Stat before reading, so a file changed after its read won't match
+    fingerprints = {path: _stat_fingerprint(path) for path in paths}
+    for path, subject_uri, _triple_count, content in _parse_files_into(graph, paths, max_workers):
+        # Collect provenance triple
+        if subject_uri:
+            resolved = Path(_real_path(path))
+            file_uri = URIRef(f"file://{resolved}")
+            provenance.append((subject_uri, _DEFINED_IN, file_uri, graph))
+            markdown[resolved] = (fingerprints.get(path), content)
+
+        files_parsed += 1
+
+    graph.addN(provenance)
+
+    # Markdown bodies by source file, reused by save_workspace
+    _loaded_markdown[graph] = markdown
+
+    logger.info(f"Loaded workspace: {files_parsed} files, {len(graph)} triples")
     return graph
 
 
@@ -173,6 +196,8 @@ def save_workspace(
 
     This groups triples by their prov:definedIn provenance and writes
     each group back to its source file, preserving markdown content.
+    Markdown captured by load_workspace() is reused for files whose stat
+    hasn't changed since; other files have their markdown read from disk.
 
     Args:
         graph: RDFlib Graph to save
@@ -188,78 +213,149 @@ def save_workspace(
     """
     workspace = Path(workspace_path)
     writer = YurtleWriter()
+    markdown_cache = _loaded_markdown.get(graph, {})
 
     # Group subjects by their source file
     file_subjects: dict[Path, list[URIRef]] = {}
+    # Keyed by Node so the scan below can look up any subject
+    subject_files: dict[Node, list[Path]] = {}
 
-    for subject, file_uri in graph.subject_objects(PROVENANCE.definedIn):
+    for subject, file_uri in graph.subject_objects(_DEFINED_IN):
         if isinstance(subject, URIRef) and isinstance(file_uri, URIRef):
             file_str = str(file_uri)
             if file_str.startswith("file://"):
                 file_path = Path(file_str[7:])
-                if file_path not in file_subjects:
-                    file_subjects[file_path] = []
-                file_subjects[file_path].append(subject)
+                file_subjects.setdefault(file_path, []).append(subject)
+                subject_files.setdefault(subject, []).append(file_path)
+
+    # Bucket every non-provenance triple by file in a single graph scan
+    file_triples: dict[Path, list] = {file_path: [] for file_path in file_subjects}
+    for s, p, o in graph:
+        if p == _DEFINED_IN:
+            continue
+        for file_path in subject_files.get(s, ()):
+            file_triples[file_path].append((s, p, o))
+
+    # Snapshot namespace bindings once for all file graphs
+    namespaces = _extra_namespace_bindings(graph)
+
+    def jobs():
+        for file_path, subjects in file_subjects.items():
+            # Build graph for this file
+            file_graph = Graph()
+            for prefix, ns in namespaces:
+                file_graph.bind(prefix, ns)
 
-    files_written = 0
+            file_graph.addN((s, p, o, file_graph) for s, p, o in file_triples[file_path])
+            yield file_path, file_graph, subjects[0] if subjects else None, markdown_cache.get(file_path)
 
-    for file_path, subjects in file_subjects.items():
+    def write(job) -> bool:
+        # Failures are per file
+        file_path, file_graph, subject_uri, loaded = job
         try:
-            # Read existing markdown content
-            markdown_content = ""
-            if file_path.exists():
-                markdown_content = _extract_markdown(file_path)
+            triple_count = _write_workspace_file(writer, file_path, file_graph, subject_uri, loaded)
+        except Exception as e:
+            logger.error(f"Failed to write {file_path}: {e}")
+            return False
+        logger.debug(f"Wrote {file_path}: {triple_count} triples")
+        return True
 
-            # Build graph for this file
-            file_graph = Graph()
-            for prefix, ns in graph.namespaces():
-                file_graph.bind(prefix, ns)
+    if len(file_subjects) <= 1:
+        written = [write(job) for job in jobs()]
+    else:
+        # Serialization and writes overlap across files, and with building
+        # the next file's graph
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(file_subjects))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            written = list(executor.map(write, jobs()))
+    files_written = sum(written)
 
-            for subject in subjects:
-                for p, o in graph.predicate_objects(subject):
-                    # Skip provenance triples
-                    if p == PROVENANCE.definedIn:
-                        continue
-                    file_graph.add((subject, p, o))
+    logger.info(f"Saved workspace: {files_written} files written")
+    return files_written
 
-            # Create document and write
-            doc = YurtleDocument(
-                graph=file_graph,
-                content=markdown_content,
-                frontmatter_raw="",
-                frontmatter_type="turtle",
-                source_path=file_path,
-                subject_uri=subjects[0] if subjects else None,
-            )
 
-            # Ensure parent directory exists
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+def _extra_namespace_bindings(graph: Graph) -> list:
+    """
+    Return the namespace bindings of graph that a new Graph() lacks.
 
-            writer.write_file(doc, file_path)
-            files_written += 1
+    Binding these on a new graph reproduces graph's prefixes without
+    re-binding every rdflib default namespace.
+    """
+    defaults = set(Graph().namespaces())
+    return [binding for binding in graph.namespaces() if binding not in defaults]
 
-            logger.debug(f"Wrote {file_path}: {len(file_graph)} triples")
 
-        except Exception as e:
-            logger.error(f"Failed to write {file_path}: {e}")
+def _stat_fingerprint(path: Path) -> Optional[_Fingerprint]:
+    """
+    Return path's (size, mtime_ns, inode), or None if it can't be trusted.
 
-    logger.info(f"Saved workspace: {files_written} files written")
-    return files_written
+    Like YurtleStore's index, a file modified within RACY_WINDOW_NS of now
+    gets no fingerprint: a quick follow-up write could leave its stat
+    unchanged.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if time.time_ns() - st.st_mtime_ns < YurtleStore.RACY_WINDOW_NS:
+        return None
+    return st.st_size, st.st_mtime_ns, st.st_ino
+
+
+def _write_workspace_file(
+    writer: YurtleWriter,
+    file_path: Path,
+    file_graph: Graph,
+    subject_uri: Optional[URIRef],
+    loaded: Optional[Tuple[Optional[_Fingerprint], str]],
+) -> int:
+    """
+    Write one file for save_workspace, returning its triple count.
+
+    loaded is the file's (fingerprint, markdown) from load_workspace(), if
+    any. The markdown is reused if the file still has that fingerprint, or
+    no longer exists; otherwise it is read from the existing file.
+    """
+    markdown_content = None
+    if loaded is not None:
+        fingerprint, body = loaded
+        if not file_path.exists():
+            # Gone since the load: its last known body is all there is
+            markdown_content = body
+        elif fingerprint is not None and _stat_fingerprint(file_path) == fingerprint:
+            markdown_content = body
+    if markdown_content is None:
+        markdown_content = ""
+        if file_path.exists():
+            markdown_content = _extract_markdown(file_path)
+
+    # Create document and write
+    doc = YurtleDocument(
+        graph=file_graph,
+        content=markdown_content,
+        frontmatter_raw="",
+        frontmatter_type="turtle",
+        source_path=file_path,
+        subject_uri=subject_uri,
+    )
+
+    # Ensure parent directory exists
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    writer.write_file(doc, file_path)
+    return len(file_graph)
 
 
 def _extract_markdown(file_path: Path) -> str:
     """Extract markdown content from a Yurtle file."""
-    import re
-
     try:
         content = file_path.read_text()
 
-        # Match frontmatter
-        pattern = re.compile(r'^---\s*\n.*?\n---\s*\n(.*)$', re.DOTALL)
-        match = pattern.match(content)
+        # Split off frontmatter
+        split = _split_frontmatter(content)
 
-        if match:
-            return match.group(1)
+        if split is not None:
+            return split[1]
 
         # No frontmatter
         return content
@@ -34,15 +34,27 @@ BACKWARDS COMPATIBLE:
 License: MIT
 """
 
+import fnmatch
+import mmap
+import os
 import re
+import stat
+import tempfile
 import yaml
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple, Union, List
+from typing import IO, Dict, Any, Iterator, Optional, Pattern, Set, Tuple, Union, List
 from dataclasses import dataclass
 from rdflib import Graph, Namespace, URIRef, Literal
 from rdflib.namespace import RDF, RDFS, XSD
+from rdflib.term import Node
 import logging
 
+from .namespaces import _bind_unbound
+
 logger = logging.getLogger(__name__)
 
 # Standard Yurtle namespaces
@@ -53,6 +65,232 @@ VOYAGE = Namespace("https://yurtle.dev/voyage/")
 KNOWLEDGE = Namespace("https://yurtle.dev/knowledge/")
 
 
+# Whitespace run, used to locate the line break after a closing delimiter
+_WHITESPACE_RUN = re.compile(r'\s*')
+
+# Run of the ASCII characters str's \s matches (a bytes \s omits \x1c-\x1f)
+_BYTES_WHITESPACE_RUN = re.compile(rb'[\t-\r\x1c-\x1f ]*')
+
+
+def _whitespace_end(text: str, pos: int = 0) -> int:
+    """Index just past the run of whitespace starting at pos."""
+    match = _WHITESPACE_RUN.match(text, pos)
+    assert match is not None  # the run may be empty, so it always matches
+    return match.end()
+
+
+def _bytes_whitespace_end(data: Union[bytes, mmap.mmap], pos: int) -> int:
+    """Index just past the run of ASCII whitespace starting at pos."""
+    match = _BYTES_WHITESPACE_RUN.match(data, pos)
+    assert match is not None  # the run may be empty, so it always matches
+    return match.end()
+
+
+def _split_frontmatter(text: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a document into (frontmatter, content), or None without frontmatter.
+
+    Equivalent to YurtleParser.FRONTMATTER_PATTERN, but documents that don't
+    start with '---' never reach the regex, and the usual layout
+    ('---\\n...\\n---\\n...') is split with str.find.
+    """
+    if not text.startswith('---'):
+        return None
+
+    if text.startswith('---\n') and not text[4:5].isspace():
+        close = text.find('\n---', 4)
+        if close != -1:
+            after = close + 4
+            newline = text.rfind('\n', after, _whitespace_end(text, after))
+            if newline != -1:
+                return text[4:close], text[newline + 1:]
+
+    match = YurtleParser.FRONTMATTER_PATTERN.match(text)
+    if not match:
+        return None
+    return match.group(1), match.group(2)
+
+
+def _split_frontmatter_bytes(data: Union[bytes, mmap.mmap]) -> Optional[Tuple[str, str]]:
+    """
+    Split raw UTF-8 file bytes into decoded (frontmatter, content).
+
+    Handles only the layout _split_frontmatter splits with str.find, and
+    returns None otherwise so the caller can decode the whole file and use
+    _split_frontmatter. The delimiters are ASCII, so byte offsets are the
+    same split points; each part is decoded straight from a memoryview
+    rather than decoding the file and then copying the body out of it.
+    """
+    if data[:4] != b'---\n':
+        return None
+    # Bytes >= 0x80 may start a non-ASCII whitespace character
+    if data[4:5] >= b'\x80' or _bytes_whitespace_end(data, 4) > 4:
+        return None
+
+    close = data.find(b'\n---', 4)
+    if close == -1:
+        return None
+    after = close + 4
+    end = _bytes_whitespace_end(data, after)
+    if data[end:end + 1] >= b'\x80':
+        return None
+    newline = data.rfind(b'\n', after, end)
+    if newline == -1:
+        return None
+
+    with memoryview(data) as view:
+        return str(view[4:close], 'utf-8'), str(view[newline + 1:], 'utf-8')
+
+
+def _decode_text(data: Union[bytes, mmap.mmap], encoding: str = 'utf-8') -> str:
+    """Decode file bytes with Path.read_text()'s universal newline handling."""
+    text = str(data, encoding)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _read_text(path: Union[str, Path], encoding: str = 'utf-8') -> str:
+    """
+    Read a text file like Path.read_text().
+
+    The file is read in one binary read() and decoded once, rather than
+    through a buffered text wrapper.
+    """
+    with open(path, 'rb') as f:
+        return _decode_text(f.read(), encoding)
+
+
+@contextmanager
+def _atomic_write(path: Union[str, Path]) -> Iterator[IO[bytes]]:
+    """
+    Open a file for writing bytes, replacing an existing file atomically.
+
+    Existing files are written to a hidden temporary file next to them
+    (next to the symlink target, for symlinks) that takes their permissions
+    and is renamed over them once complete, so a crash or error mid-write
+    leaves the old contents in place. New files are written directly.
+    """
+    target = os.path.realpath(path)
+    try:
+        mode = stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        with open(target, 'wb', buffering=1 << 20) as f:
+            yield f
+        return
+
+    directory, name = os.path.split(target)
+    fd, tmp = tempfile.mkstemp(prefix=f'.{name}.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb', buffering=1 << 20) as f:
+            yield f
+        os.chmod(tmp, mode)
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _fsync_directory(directory: Union[str, Path]) -> None:
+    """Flush a directory's entries (e.g. renames) to disk, where supported."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass  # Not supported for directories on this platform
+    finally:
+        os.close(fd)
+
+
+def _read_document(path: Path) -> Tuple[Optional[str], str]:
+    """
+    Read a file and split it into (frontmatter, content).
+
+    frontmatter is None for files without frontmatter, in which case
+    content is the whole text.
+    """
+    with open(path, 'rb') as f:
+        return _split_document(f.read())
+
+
+def _split_document(data: Union[bytes, mmap.mmap]) -> Tuple[Optional[str], str]:
+    """
+    Split raw UTF-8 file bytes into (frontmatter, content) like _read_document.
+
+    data may be any bytes-like object with find(), such as an mmap.
+    """
+    if b'\r' not in data:
+        split = _split_frontmatter_bytes(data)
+        if split is not None:
+            return split
+    text = _decode_text(data)
+    split = _split_frontmatter(text)
+    if split is None:
+        return None, text
+    return split
+
+
+@lru_cache(maxsize=1024)
+def _local_name(predicate: URIRef) -> str:
+    """Return the last path or fragment segment of a predicate URI."""
+    return str(predicate).split('/')[-1].split('#')[-1]
+
+
+@lru_cache(maxsize=16384)
+def _uri(iri: str) -> URIRef:
+    """
+    Return a shared URIRef for an IRI.
+
+    URIRefs can't be weakly referenced, so this is a bounded cache rather
+    than a weak intern table. Terms repeated across files (predicates,
+    types, shared objects) then come back as one object: the graph holds
+    a single copy, dict lookups hit on identity, and URIRef validation
+    runs once per IRI.
+    """
+    return URIRef(iri)
+
+
+@lru_cache(maxsize=4096)
+def _doc_uri(stem: str) -> URIRef:
+    """Return the default subject URI for a file stem."""
+    return URIRef(f"urn:doc:{stem}")
+
+
+@lru_cache(maxsize=1024)
+def _real_dir(directory: str) -> str:
+    """Return os.path.realpath(directory), cached per directory."""
+    return os.path.realpath(directory)
+
+
+def _real_path(path: Union[str, Path]) -> str:
+    """
+    Return os.path.realpath(path), resolving each directory only once.
+
+    Files in one directory share a cached directory resolution, so only a
+    file that is itself a symlink needs a full realpath() walk. The cache
+    assumes directory symlinks don't change while it's in use;
+    load_workspace(), YurtleStore.sync() and the parser plugin's parse()
+    and parse_many() clear it before each batch.
+    """
+    path = os.fspath(path)
+    directory, name = os.path.split(path)
+    if not name or name in ('.', '..') or os.path.islink(path):
+        return os.path.realpath(path)
+    if not os.path.isabs(directory):
+        directory = os.path.join(os.getcwd(), directory)
+    return os.path.join(_real_dir(directory), name)
+
+
+# A document's triples: its per-file Graph, or a set from the fast parser
+_Triples = Union[Graph, Set[Tuple[Node, Node, Node]]]
+
+
 @dataclass
 class YurtleDocument:
     """A parsed Yurtle document with both graph and content."""
@@ -76,33 +314,31 @@ class YurtleDocument:
     subject_uri: Optional[URIRef] = None
 
     def get_property(self, predicate: URIRef) -> Optional[str]:
-        """Get a single property value from the graph."""
+        """
+        Get a single property value from the graph.
+
+        Values are returned as plain strings, since rdflib terms do not
+        compare equal to str; use graph.value(...).toPython() for typed values.
+        """
         if self.subject_uri:
-            for obj in self.graph.objects(self.subject_uri, predicate):
+            obj = next(self.graph.objects(self.subject_uri, predicate), None)
+            if obj is not None:
                 return str(obj)
         return None
 
     def get_properties(self, predicate: URIRef) -> List[str]:
-        """Get all values for a predicate."""
+        """Get all values for a predicate (as plain strings, like get_property)."""
         if self.subject_uri:
-            return [str(obj) for obj in self.graph.objects(self.subject_uri, predicate)]
+            return list(map(str, self.graph.objects(self.subject_uri, predicate)))
         return []
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert graph to dictionary (for YAML compatibility)."""
-        result: Dict[str, Any] = {}
+        buckets: Dict[str, List[str]] = defaultdict(list)
         if self.subject_uri:
             for pred, obj in self.graph.predicate_objects(self.subject_uri):
-                key = str(pred).split('/')[-1].split('#')[-1]
-                value = str(obj)
-                if key in result:
-                    if isinstance(result[key], list):
-                        result[key].append(value)
-                    else:
-                        result[key] = [result[key], value]
-                else:
-                    result[key] = value
-        return result
+                buckets[_local_name(pred)].append(str(obj))
+        return {key: values[0] if len(values) == 1 else values for key, values in buckets.items()}
 
 
 class YurtleParser:
@@ -121,6 +357,29 @@ class YurtleParser:
         re.DOTALL
     )
 
+    # Tokenizer for the flat Turtle subset handled by _parse_turtle_fast.
+    # Anything it cannot match (blank nodes, collections, long or escaped
+    # strings, ...) makes the fast path bail out. Whitespace and digits are
+    # Turtle's ASCII sets, not Unicode \s and \d, so input rdflib rejects
+    # isn't accepted here.
+    TURTLE_TOKEN_PATTERN = re.compile(
+        r'(?:[ \t\r\n]|#[^\n]*)*(?:'
+        r'(?P<iri><[^<>"{}|^`\\\x00-\x20]*>)'
+        r'|"(?P<string>[^"\\\r\n]*)"(?!")(?:@(?P<lang>[A-Za-z]+(?:-[A-Za-z0-9]+)*))?'
+        r'|(?P<caret>\^\^)'
+        r'|(?P<directive>@prefix)(?![\w-])'
+        r'|(?P<decimal>[+-]?[0-9]*\.[0-9]+)(?![\w]|\.[0-9])'
+        r'|(?P<integer>[+-]?[0-9]+)(?![\w])'
+        r'|(?P<pname>(?:[A-Za-z][\w-]*)?:(?:\w[\w-]*)?)(?![:%\\]|\.[\w:%-])'
+        r'|(?P<keyword>a|true|false)(?![\w:-])'
+        r'|(?P<punct>[.;,])'
+        r'|(?P<end>\Z)'
+        r')'
+    )
+
+    # Turtle starts with @prefix, @base, or a URI
+    TURTLE_PREFIXES = ('@prefix', '@base', '<', 'PREFIX', 'BASE')
+
     # Standard namespace prefixes
     STANDARD_PREFIXES = {
         'yurtle': YURTLE,
@@ -133,8 +392,37 @@ class YurtleParser:
         'xsd': XSD,
     }
 
+    # Map common YAML keys to predicates
+    YAML_KEY_MAPPINGS = {
+        'type': RDF.type,
+        'title': YURTLE.title,
+        'status': PM.status,
+        'priority': PM.priority,
+        'assignee': PM.assignedTo,
+        'assigned_to': PM.assignedTo,
+        'created': YURTLE.created,
+        'updated': YURTLE.updated,
+        'tags': YURTLE.tag,
+        'labels': YURTLE.label,
+        'methodology': PM.methodology,
+        'domain': BEING.domain,
+        'name': YURTLE.name,
+        'description': YURTLE.description,
+    }
+
+    # Typed literal constructors for YAML scalars, keyed by exact type
+    YAML_LITERAL_BUILDERS = {
+        bool: lambda value, datatype=XSD.boolean: Literal(value, datatype=datatype),
+        int: lambda value, datatype=XSD.integer: Literal(value, datatype=datatype),
+        float: lambda value, datatype=XSD.decimal: Literal(value, datatype=datatype),
+    }
+
+    # Maximum number of distinct YAML key sequences cached by _yaml_predicates
+    YAML_SCHEMA_CACHE_SIZE = 256
+
     def __init__(self):
         self.logger = logging.getLogger("yurtle-parser")
+        self._yaml_schemas: Dict[Tuple[Tuple[type, Any], ...], Tuple[URIRef, ...]] = {}
 
     def parse(self, text: str, source_path: Optional[Path] = None) -> YurtleDocument:
         """
@@ -147,24 +435,37 @@ class YurtleParser:
         Returns:
             YurtleDocument with parsed graph and content
         """
-        match = self.FRONTMATTER_PATTERN.match(text)
+        split = _split_frontmatter(text)
+        if split is None:
+            return self._parse_frontmatter(None, text, source_path)
+        return self._parse_frontmatter(split[0], split[1], source_path)
+
+    def _parse_frontmatter(
+        self,
+        frontmatter_raw: Optional[str],
+        content: str,
+        source_path: Optional[Path],
+        try_fast: bool = True,
+    ) -> YurtleDocument:
+        """
+        Build a YurtleDocument from already-split frontmatter and content.
 
-        if not match:
+        try_fast=False skips the fast Turtle parser, for callers that already
+        found the frontmatter outside its subset.
+        """
+        if frontmatter_raw is None:
             # No frontmatter
             return YurtleDocument(
                 graph=Graph(),
-                content=text,
+                content=content,
                 frontmatter_raw="",
                 frontmatter_type="none",
                 source_path=source_path
             )
 
-        frontmatter_raw = match.group(1)
-        content = match.group(2)
-
         # Detect frontmatter type
         if self._is_turtle(frontmatter_raw):
-            graph, subject_uri = self._parse_turtle(frontmatter_raw, source_path)
+            graph, subject_uri = self._parse_turtle(frontmatter_raw, source_path, try_fast)
             frontmatter_type = "turtle"
         else:
             graph, subject_uri = self._parse_yaml(frontmatter_raw, source_path)
@@ -182,31 +483,105 @@ class YurtleParser:
     def parse_file(self, path: Union[str, Path]) -> YurtleDocument:
         """Parse a Yurtle document from a file."""
         path = Path(path)
-        text = path.read_text(encoding='utf-8')
-        return self.parse(text, source_path=path)
+        frontmatter_raw, content = _read_document(path)
+        return self._parse_frontmatter(frontmatter_raw, content, path)
+
+    def parse_bytes(
+        self, data: Union[bytes, mmap.mmap], source_path: Optional[Path] = None
+    ) -> YurtleDocument:
+        """
+        Parse a Yurtle document from raw UTF-8 file bytes.
+
+        Gives the same document as parse_file() on a file holding data, so
+        a caller that already has the file's bytes (or an mmap of them)
+        doesn't read it again.
+        """
+        frontmatter_raw, content = _split_document(data)
+        return self._parse_frontmatter(frontmatter_raw, content, source_path)
+
+    def _parse_file_into(self, path: Path, target: Graph) -> Tuple[Optional[URIRef], int, str]:
+        """
+        Parse a file and add its triples straight to target.
+
+        Equivalent to parse_file() followed by adding the document graph's
+        triples to target, but Turtle frontmatter the fast parser handles
+        skips building the per-file Graph. As when adding doc.graph's
+        triples, the document's prefix bindings are not copied.
+
+        Returns:
+            (subject_uri, triple_count, markdown_content)
+        """
+        frontmatter_raw, content = _read_document(path)
+        subject_uri, triples, content = self._parse_triples(frontmatter_raw, content, path)
+        target.addN((s, p, o, target) for s, p, o in triples)
+        return subject_uri, len(triples), content
+
+    def _parse_bytes_triples(
+        self, data: Union[bytes, mmap.mmap], source_path: Optional[Path] = None
+    ) -> Tuple[Optional[URIRef], _Triples, str]:
+        """
+        Parse raw UTF-8 file bytes into the document's triples.
+
+        The triples of parse_bytes(data).graph, without the per-file Graph
+        where the fast Turtle parser applies.
+
+        Returns:
+            (subject_uri, triples, markdown_content)
+        """
+        frontmatter_raw, content = _split_document(data)
+        return self._parse_triples(frontmatter_raw, content, source_path)
+
+    def _parse_triples(
+        self, frontmatter_raw: Optional[str], content: str, source_path: Optional[Path]
+    ) -> Tuple[Optional[URIRef], _Triples, str]:
+        """Parse already-split frontmatter into (subject_uri, triples, content)."""
+        fast = None
+        tried_fast = False
+        if frontmatter_raw is not None and self._is_turtle(frontmatter_raw):
+            tried_fast = True
+            try:
+                fast = self._parse_turtle_fast(frontmatter_raw)
+            except Exception:
+                # Let the regular path report the error
+                fast = None
+
+        if fast is None:
+            # Turtle already rejected by the fast parser goes straight to rdflib
+            doc = self._parse_frontmatter(frontmatter_raw, content, source_path, try_fast=not tried_fast)
+            return doc.subject_uri, doc.graph, doc.content
+
+        # A set built in the same order as the per-file graph's store, so
+        # the main subject and the insertion order into a target match
+        triples: Set[Tuple[Node, Node, Node]] = set(fast[1])
+        subject_uri = next((s for s, _, _ in triples if isinstance(s, URIRef)), None)
+        if subject_uri is None and source_path:
+            subject_uri = self._uri_from_path(source_path)
+            triples.add((subject_uri, RDF.type, YURTLE.Document))
+        return subject_uri, triples, content
 
     def _is_turtle(self, frontmatter: str) -> bool:
         """Check if frontmatter is Turtle format."""
-        stripped = frontmatter.strip()
-        # Turtle starts with @prefix, @base, or a URI
-        return (
-            stripped.startswith('@prefix') or
-            stripped.startswith('@base') or
-            stripped.startswith('<') or
-            stripped.startswith('PREFIX') or
-            stripped.startswith('BASE')
-        )
+        # Peek past leading whitespace without copying the frontmatter
+        start = _whitespace_end(frontmatter)
+        return frontmatter.startswith(self.TURTLE_PREFIXES, start)
 
-    def _parse_turtle(self, frontmatter: str, source_path: Optional[Path]) -> Tuple[Graph, Optional[URIRef]]:
+    def _parse_turtle(
+        self, frontmatter: str, source_path: Optional[Path], try_fast: bool = True
+    ) -> Tuple[Graph, Optional[URIRef]]:
         """Parse Turtle frontmatter into an RDF graph."""
         graph = Graph()
 
         # Bind standard prefixes
-        for prefix, ns in self.STANDARD_PREFIXES.items():
-            graph.bind(prefix, ns)
+        _bind_unbound(graph, self.STANDARD_PREFIXES.items())
 
         try:
-            graph.parse(data=frontmatter, format='turtle')
+            fast = self._parse_turtle_fast(frontmatter) if try_fast else None
+            if fast is not None:
+                bindings, triples = fast
+                _bind_unbound(graph, bindings)
+                graph.addN((s, p, o, graph) for s, p, o in triples)
+            else:
+                graph.parse(data=frontmatter, format='turtle')
 
             # Find the main subject (first subject that's a URIRef)
             subject_uri = None
@@ -226,13 +601,121 @@ class YurtleParser:
             self.logger.error(f"Failed to parse Turtle frontmatter: {e}")
             return Graph(), None
 
+    def _parse_turtle_fast(
+        self, frontmatter: str
+    ) -> Optional[Tuple[List[Tuple[str, URIRef]], List[Tuple[URIRef, URIRef, Node]]]]:
+        """
+        Parse flat Turtle frontmatter without the rdflib Turtle parser.
+
+        Handles @prefix directives and statements built from IRIs, prefixed
+        names, short strings, numbers and booleans. Returns None for anything
+        else so the caller can fall back to the full parser.
+
+        Returns:
+            (prefix bindings, triples) or None if the fast path does not apply
+        """
+        tokens: List[Tuple[str, str, Optional[str]]] = []
+        pos = 0
+        while True:
+            match = self.TURTLE_TOKEN_PATTERN.match(frontmatter, pos)
+            if not match or match.lastgroup is None:
+                return None
+            if match.lastgroup == 'end':
+                break
+            kind = 'string' if match.lastgroup == 'lang' else match.lastgroup
+            tokens.append((kind, match.group(kind), match.group('lang')))
+            pos = match.end()
+
+        prefixes: Dict[str, str] = {}
+        bindings = []
+        triples = []
+        i = 0
+
+        try:
+            while i < len(tokens):
+                if tokens[i][0] == 'directive':
+                    (k1, name, _), (k2, iri, _), (k3, dot, _) = tokens[i + 1:i + 4]
+                    if k1 != 'pname' or not name.endswith(':') or k2 != 'iri' or dot != '.':
+                        return None
+                    ns = self._fast_term(tokens[i + 2], prefixes)
+                    prefixes[name[:-1]] = ns
+                    bindings.append((name[:-1], ns))
+                    i += 4
+                    continue
+
+                subject = self._fast_term(tokens[i], prefixes)
+                i += 1
+                while True:
+                    if tokens[i][:2] == ('keyword', 'a'):
+                        predicate = RDF.type
+                    else:
+                        predicate = self._fast_term(tokens[i], prefixes)
+                    i += 1
+
+                    while True:
+                        obj, i = self._fast_object(tokens, i, prefixes)
+                        triples.append((subject, predicate, obj))
+                        if tokens[i][:2] != ('punct', ','):
+                            break
+                        i += 1
+
+                    if tokens[i][:2] == ('punct', '.'):
+                        i += 1
+                        break
+                    if tokens[i][:2] != ('punct', ';'):
+                        return None
+                    while tokens[i][:2] == ('punct', ';'):
+                        i += 1
+                    if tokens[i][:2] == ('punct', '.'):
+                        i += 1
+                        break
+
+        except (IndexError, ValueError):
+            return None
+
+        return bindings, triples
+
+    def _fast_term(self, token: Tuple[str, str, Optional[str]], prefixes: Dict[str, str]) -> URIRef:
+        """Resolve an IRI or prefixed-name token, raising ValueError otherwise."""
+        kind, text, _ = token
+        if kind == 'iri':
+            iri = text[1:-1]
+            if ':' not in iri:
+                # Relative IRIs need base resolution
+                raise ValueError(iri)
+            return _uri(iri)
+        if kind == 'pname':
+            prefix, _, local = text.partition(':')
+            if prefix not in prefixes:
+                raise ValueError(prefix)
+            return _uri(prefixes[prefix] + local)
+        raise ValueError(text)
+
+    def _fast_object(
+        self, tokens: List[Tuple[str, str, Optional[str]]], i: int, prefixes: Dict[str, str]
+    ) -> Tuple[Node, int]:
+        """Parse the object at tokens[i], returning it and the next index."""
+        kind, text, lang = tokens[i]
+        if kind == 'string':
+            if tokens[i + 1][0] == 'caret':
+                if lang:
+                    raise ValueError(text)
+                return Literal(text, datatype=self._fast_term(tokens[i + 2], prefixes)), i + 3
+            return Literal(text, lang=lang), i + 1
+        if kind == 'integer':
+            return Literal(int(text), datatype=XSD.integer), i + 1
+        if kind == 'decimal':
+            return Literal(text, datatype=XSD.decimal), i + 1
+        if kind == 'keyword' and text != 'a':
+            return Literal(text, datatype=XSD.boolean), i + 1
+        return self._fast_term(tokens[i], prefixes), i + 1
+
     def _parse_yaml(self, frontmatter: str, source_path: Optional[Path]) -> Tuple[Graph, Optional[URIRef]]:
         """Parse YAML frontmatter and convert to RDF graph."""
         graph = Graph()
 
         # Bind standard prefixes
-        for prefix, ns in self.STANDARD_PREFIXES.items():
-            graph.bind(prefix, ns)
+        _bind_unbound(graph, self.STANDARD_PREFIXES.items())
 
         try:
             data = yaml.safe_load(frontmatter)
@@ -258,54 +741,50 @@ class YurtleParser:
 
     def _yaml_to_triples(self, graph: Graph, subject: URIRef, data: Dict[str, Any]):
         """Convert YAML dict to RDF triples."""
-        # Map common YAML keys to predicates
-        key_mappings = {
-            'type': RDF.type,
-            'title': YURTLE.title,
-            'status': PM.status,
-            'priority': PM.priority,
-            'assignee': PM.assignedTo,
-            'assigned_to': PM.assignedTo,
-            'created': YURTLE.created,
-            'updated': YURTLE.updated,
-            'tags': YURTLE.tag,
-            'labels': YURTLE.label,
-            'methodology': PM.methodology,
-            'domain': BEING.domain,
-            'name': YURTLE.name,
-            'description': YURTLE.description,
-        }
-
-        for key, value in data.items():
-            predicate = key_mappings.get(key, YURTLE[key])
+        values = data.values()
+        to_node = self._yaml_value_to_node
+        quads = []
 
+        for predicate, value in zip(self._yaml_predicates(tuple(data)), values):
             if isinstance(value, list):
                 for item in value:
-                    self._add_triple(graph, subject, predicate, item)
+                    quads.append((subject, predicate, to_node(item), graph))
             else:
-                self._add_triple(graph, subject, predicate, value)
-
-    def _add_triple(self, graph: Graph, subject: URIRef, predicate: URIRef, value: Any):
-        """Add a triple with appropriate literal type."""
-        if isinstance(value, bool):
-            obj = Literal(value, datatype=XSD.boolean)
-        elif isinstance(value, int):
-            obj = Literal(value, datatype=XSD.integer)
-        elif isinstance(value, float):
-            obj = Literal(value, datatype=XSD.decimal)
-        elif isinstance(value, str) and value.startswith('urn:'):
-            obj = URIRef(value)
-        elif isinstance(value, str) and value.startswith('http'):
-            obj = URIRef(value)
-        else:
-            obj = Literal(str(value))
+                quads.append((subject, predicate, to_node(value), graph))
+
+        graph.addN(quads)
+
+    def _yaml_predicates(self, keys: Tuple[Any, ...]) -> Tuple[URIRef, ...]:
+        """
+        Resolve the predicates for a sequence of YAML keys.
 
-        graph.add((subject, predicate, obj))
+        Files in a workspace tend to share a handful of frontmatter schemas,
+        so the resolved tuple is cached per key sequence (up to
+        YAML_SCHEMA_CACHE_SIZE schemas per parser). Each key is cached with
+        its exact type, since equal keys like True and 1 hash alike.
+        """
+        schema = tuple((type(key), key) for key in keys)
+        predicates = self._yaml_schemas.get(schema)
+        if predicates is None:
+            key_mappings = self.YAML_KEY_MAPPINGS
+            predicates = tuple(key_mappings.get(key) or YURTLE[key] for key in keys)
+            if len(self._yaml_schemas) < self.YAML_SCHEMA_CACHE_SIZE:
+                self._yaml_schemas[schema] = predicates
+        return predicates
+
+    def _yaml_value_to_node(self, value: Any) -> Node:
+        """Convert a YAML value to an RDF node with appropriate literal type."""
+        builder = self.YAML_LITERAL_BUILDERS.get(type(value))
+        if builder is not None:
+            return builder(value)
+        if isinstance(value, str) and value.startswith(('urn:', 'http')):
+            return URIRef(value)
+        return Literal(str(value))
 
     def _uri_from_path(self, path: Path) -> URIRef:
         """Generate a URIRef from a file path."""
         # Use file stem as default
-        return URIRef(f"urn:doc:{path.stem}")
+        return _doc_uri(path.stem)
 
 
 class YurtleWriter:
@@ -326,43 +805,448 @@ class YurtleWriter:
 
         return f"---\n{frontmatter}\n---\n{doc.content}"
 
+    # Predicates written first, mirroring rdflib's Turtle serializer
+    PREDICATE_ORDER = (RDF.type, RDFS.label)
+
     def _serialize_turtle(self, graph: Graph) -> str:
         """Serialize graph to Turtle format."""
+        fast = self._serialize_turtle_fast(graph)
+        if fast is not None:
+            return fast
+
         result = graph.serialize(format='turtle')
         # Handle bytes vs string return (depends on rdflib version)
         if isinstance(result, bytes):
             return result.decode('utf-8')
         return result
 
-    def write_file(self, doc: YurtleDocument, path: Union[str, Path]):
-        """Write a YurtleDocument to a file."""
+    def _serialize_turtle_bytes(self, graph: Graph) -> bytes:
+        """Serialize graph to UTF-8 Turtle, as write_file() would write it."""
+        fast = self._serialize_turtle_fast(graph)
+        if fast is not None:
+            return fast.encode('utf-8')
+        return graph.serialize(format='turtle', encoding='utf-8')
+
+    def _serialize_turtle_fast(self, graph: Graph) -> Optional[str]:
+        """
+        Serialize a single-subject graph without rdflib's Turtle serializer.
+
+        Covers the typical Yurtle file: one URIRef subject whose objects are
+        URIRefs or literals, with every predicate under a bound prefix. The
+        output uses the same layout as rdflib's serializer. Returns None for
+        any other graph so the caller can fall back to rdflib.
+        """
+        subject = None
+        properties: Dict[URIRef, List[Union[URIRef, Literal]]] = {}
+        for s, p, o in graph:
+            if subject is None:
+                subject = s
+            elif s != subject:
+                return None
+            if not isinstance(p, URIRef) or not isinstance(o, (URIRef, Literal)):
+                return None
+            properties.setdefault(p, []).append(o)
+
+        if not isinstance(subject, URIRef):
+            return None
+
+        used: Dict[str, URIRef] = {}
+
+        def qname(uri: URIRef) -> Optional[str]:
+            try:
+                prefix, namespace, local = graph.compute_qname(uri, generate=False)
+            except Exception:
+                return None
+            if local.endswith('.') or prefix.startswith('_'):
+                return None
+            used[prefix] = namespace
+            local = local.replace('(', r'\(').replace(')', r'\)')
+            return f"{prefix}:{local}"
+
+        def label(node: Union[URIRef, Literal]) -> str:
+            if isinstance(node, Literal):
+                if node.datatype:
+                    # rdflib declares the datatype prefix even for plain numbers
+                    qname(node.datatype)
+                return node._literal_n3(use_plain=True, qname_callback=qname)
+            return qname(node) or node.n3()
+
+        predicates = [p for p in self.PREDICATE_ORDER if p in properties]
+        predicates.extend(sorted(p for p in properties if p not in self.PREDICATE_ORDER))
+
+        try:
+            statements = []
+            for predicate in predicates:
+                verb = 'a' if predicate == RDF.type else qname(predicate)
+                if verb is None:
+                    # rdflib would generate an nsN prefix for this predicate
+                    return None
+                objects = ',\n        '.join(label(o) for o in sorted(properties[predicate]))
+                statements.append(f"{verb} {objects}")
+            body = f"{label(subject)} " + ' ;\n    '.join(statements)
+        except Exception:
+            return None
+
+        prefixes = ''.join(f"@prefix {prefix}: <{ns}> .\n" for prefix, ns in sorted(used.items()))
+        return f"{prefixes}\n{body} .\n\n"
+
+    def write_file(
+        self,
+        doc: YurtleDocument,
+        path: Union[str, Path],
+        frontmatter: Optional[bytes] = None,
+    ):
+        """
+        Write a YurtleDocument to a file.
+
+        Produces the same text as write(), but Turtle frontmatter is
+        serialized straight into a buffered file instead of an
+        intermediate string. An existing file is replaced atomically, so
+        it is never left half-written.
+
+        Args:
+            doc: Document to write
+            path: Output file path
+            frontmatter: Turtle for doc.graph from _serialize_turtle_bytes(),
+                written instead of serializing the graph again
+        """
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        text = self.write(doc)
-        path.write_text(text, encoding='utf-8')
+        with _atomic_write(path) as f:
+            if frontmatter is not None:
+                f.write(b"---\n")
+                f.write(frontmatter)
+                f.write(b"\n---\n")
+            elif doc.frontmatter_type == "turtle" or doc.graph:
+                f.write(b"---\n")
+                fast = self._serialize_turtle_fast(doc.graph)
+                if fast is not None:
+                    f.write(fast.encode('utf-8'))
+                else:
+                    doc.graph.serialize(destination=f, format='turtle', encoding='utf-8')
+                f.write(b"\n---\n")
+            elif doc.frontmatter_raw:
+                f.write(f"---\n{doc.frontmatter_raw}\n---\n".encode())
+            f.write(doc.content.encode('utf-8'))
 
 
 # Convenience functions
 
+# Shared parser for module-level helpers (it only caches immutable lookups)
+_DEFAULT_PARSER = YurtleParser()
+
+
 def parse_yurtle(text: str, source_path: Optional[Path] = None) -> YurtleDocument:
     """Parse a Yurtle document from text."""
-    parser = YurtleParser()
-    return parser.parse(text, source_path)
+    return _DEFAULT_PARSER.parse(text, source_path)
 
 
 def parse_yurtle_file(path: Union[str, Path]) -> YurtleDocument:
     """Parse a Yurtle document from a file."""
-    parser = YurtleParser()
-    return parser.parse_file(path)
+    return _DEFAULT_PARSER.parse_file(path)
+
+
+# Worker process tasks per worker; each task parses a chunk of files
+PARALLEL_CHUNKS_PER_WORKER = 4
+
 
+@lru_cache(maxsize=64)
+def _compile_name_patterns(name_patterns: Tuple[str, ...]) -> Pattern[str]:
+    """
+    Compile file name globs into one regex matching any of them.
+
+    Case-insensitive where the OS is (as fnmatch.fnmatch would be).
+    """
+    flags = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+    return re.compile('|'.join(fnmatch.translate(p) for p in name_patterns), flags)
+
+
+def _scan_files(directory: str, name_re: Pattern[str], recursive: bool) -> Iterator[str]:
+    """
+    Yield paths of non-hidden files whose name matches name_re.
 
-def scan_workspace_graph(workspace_path: Union[str, Path], patterns: Optional[List[str]] = None) -> Graph:
+    Walks with os.scandir, so file/directory checks use the cached
+    DirEntry type instead of a stat() per Path. Like Path.glob('**'),
+    symlinked directories are not descended into.
+    """
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        name = entry.name
+                        if not name.startswith('.') and name_re.match(name):
+                            yield entry.path
+                    elif recursive and entry.is_dir() and not entry.is_symlink():
+                        subdirs.append(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        return
+
+    for subdir in subdirs:
+        yield from _scan_files(subdir, name_re, recursive)
+
+
+def _decompose_shallow_wildcard(pattern: str) -> Optional[Tuple[List[str], bool, str]]:
+    """
+    Split a glob pattern into (directory segments, recursive, name pattern).
+
+    Handles patterns made of plain '*'/'?' segments with at most one '**'
+    right before the file name, e.g. '*.md', '*/*.md', 'docs/**/*.md'.
+    Returns None for anything else ('[...]' classes, '{...}', '..', inner
+    '**'), which is left to Path.glob.
+    """
+    if not pattern or pattern.startswith('/') or '[' in pattern or '{' in pattern:
+        return None
+
+    *dir_parts, name_pattern = pattern.split('/')
+    recursive = bool(dir_parts) and dir_parts[-1] == '**'
+    if recursive:
+        dir_parts.pop()
+    if not name_pattern or '**' in name_pattern:
+        return None
+    for part in dir_parts:
+        if part in ('', '.', '..') or '**' in part:
+            return None
+    return dir_parts, recursive, name_pattern
+
+
+def _expand_directories(directory: str, dir_parts: List[str]) -> List[str]:
+    """
+    Return the directories under directory matching the segments dir_parts.
+
+    Like Path.glob, wildcard segments match hidden and symlinked directories.
+    """
+    directories = [directory]
+    for part in dir_parts:
+        matched = []
+        part_re = _compile_name_patterns((part,))
+        for parent in directories:
+            if '*' not in part and '?' not in part:
+                child = os.path.join(parent, part)
+                if os.path.isdir(child):
+                    matched.append(child)
+                continue
+            try:
+                with os.scandir(parent) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir() and part_re.match(entry.name):
+                                matched.append(entry.path)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        directories = matched
+    return directories
+
+
+def _scan_directories(
+    directories: List[str], name_re: Pattern[str], recursive: bool
+) -> List[str]:
+    """
+    Run _scan_files over several directories, in parallel when there are many.
+
+    A recursive walk of a single directory is split into a shallow scan of
+    that directory plus one walk per subdirectory, so the walks of separate
+    top-level trees overlap. Results keep the order of a sequential walk.
+    """
+    if recursive and len(directories) == 1:
+        root = directories[0]
+        files = list(_scan_files(root, name_re, recursive=False))
+        subdirs = []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir() and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return files + _scan_directories(subdirs, name_re, recursive)
+
+    if len(directories) < 2:
+        return [path for directory in directories for path in _scan_files(directory, name_re, recursive)]
+
+    # os.scandir releases the GIL, so directory walks overlap in threads
+    with ThreadPoolExecutor() as executor:
+        results = executor.map(lambda d: list(_scan_files(d, name_re, recursive)), directories)
+        return [path for result in results for path in result]
+
+
+def _collect_workspace_files(workspace_path: Path, patterns: List[str]) -> List[Path]:
+    """
+    Return all non-hidden files under workspace_path matching patterns.
+
+    Shallow wildcards ('*.md', '*/*.md', '**/*.md', ...) are served by
+    os.scandir walks, run in parallel per directory; any other pattern goes
+    through Path.glob. Shallow patterns that differ only in the file name
+    ('**/*.md', '**/*.markdown') share one walk, matching names against a
+    single compiled regex.
+    """
+    paths: List[Path] = []
+    walks: Dict[Tuple[Tuple[str, ...], bool], List[str]] = {}
+    for pattern in patterns:
+        decomposed = _decompose_shallow_wildcard(pattern)
+        if decomposed is None:
+            paths.extend(
+                path for path in workspace_path.glob(pattern)
+                if path.is_file() and not path.name.startswith('.')
+            )
+            continue
+        dir_parts, recursive, name_pattern = decomposed
+        walks.setdefault((tuple(dir_parts), recursive), []).append(name_pattern)
+
+    for (walk_parts, recursive), name_patterns in walks.items():
+        name_re = _compile_name_patterns(tuple(name_patterns))
+        directories = _expand_directories(str(workspace_path), list(walk_parts))
+        paths.extend(map(Path, _scan_directories(directories, name_re, recursive)))
+    return paths
+
+
+def _may_have_frontmatter(path: Path) -> bool:
+    """
+    Cheap pre-check on the first bytes of a file.
+
+    Only files starting with '---' can have frontmatter; everything else
+    contributes no triples. Unreadable files return True so the parse
+    step reports the error.
+    """
+    try:
+        with open(path, 'rb') as f:
+            return f.read(3) == b'---'
+    except OSError:
+        return True
+
+
+def _parse_one(path: Path) -> Tuple[bytes, Optional[str], int, str]:
+    """
+    Parse a single file in a worker process.
+
+    The graph is returned as N-Triples bytes, which cross the pickle
+    boundary far more cheaply than a Graph object.
+    """
+    doc = _DEFAULT_PARSER.parse_file(path)
+    ntriples = doc.graph.serialize(format='nt', encoding='utf-8')
+    subject = str(doc.subject_uri) if doc.subject_uri else None
+    return ntriples, subject, len(doc.graph), doc.content
+
+
+def _parse_chunk(
+    paths: List[Path],
+) -> Tuple[bytes, List[Tuple[Path, Optional[str], int, str]], List[Tuple[Path, str]]]:
+    """
+    Parse a chunk of files in a worker process.
+
+    The chunk's triples come back as one N-Triples payload, so the parent
+    makes one pickle round trip and one graph.parse() call per chunk.
+
+    Returns:
+        (N-Triples bytes, (path, subject, triple_count, content) for each
+        parsed file, (path, error message) for each file that failed)
+    """
+    payload = []
+    parsed = []
+    failed = []
+    for path in paths:
+        try:
+            ntriples, subject, triple_count, content = _parse_one(path)
+        except Exception as e:
+            failed.append((path, str(e)))
+            continue
+        payload.append(ntriples)
+        parsed.append((path, subject, triple_count, content))
+    return b"".join(payload), parsed, failed
+
+
+def _parse_files_into(
+    graph: Graph,
+    paths: List[Path],
+    max_workers: Optional[int] = None,
+) -> Iterator[Tuple[Path, Optional[URIRef], int, str]]:
+    """
+    Parse files and add their triples to a graph.
+
+    Files without a leading '---' are skipped without being read in full,
+    since they cannot contribute triples. The rest are parsed in this
+    process unless max_workers > 1 is given and the host has more than one
+    CPU; then they are parsed in a process pool. Worker processes need the
+    calling script to be importable without side effects (an
+    ``if __name__ == "__main__"`` guard) under the spawn and forkserver
+    start methods; if the pool breaks, or a chunk of files fails as a
+    whole, those files are parsed in this process instead. Files that fail
+    to parse are logged and skipped.
+
+    Args:
+        graph: Graph to add the parsed triples to
+        paths: Files to parse
+        max_workers: Worker process count (default: None, parse in this process)
+
+    Yields:
+        (path, subject_uri, triple_count, markdown_content) for each
+        successfully parsed file
+    """
+    paths = [path for path in paths if _may_have_frontmatter(path)]
+
+    if max_workers is None or max_workers < 2 or (os.cpu_count() or 1) < 2 or len(paths) < 2:
+        yield from _parse_files_serially(graph, paths)
+        return
+
+    # Files go to the workers in chunks, a few per worker so uneven files
+    # still balance across the pool
+    size = max(1, len(paths) // (max_workers * PARALLEL_CHUNKS_PER_WORKER))
+    chunks = [paths[i:i + size] for i in range(0, len(paths), size)]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_parse_chunk, chunk) for chunk in chunks]
+        for chunk, future in zip(chunks, futures):
+            try:
+                ntriples, parsed, failed = future.result()
+                if ntriples:
+                    graph.parse(data=ntriples, format='nt')
+            except Exception as e:
+                # The pool broke (e.g. an unguarded script under spawn) or
+                # the chunk failed as a whole: parse its files here rather
+                # than return a graph with them missing
+                logger.warning(f"Process pool failed ({e}); parsing {len(chunk)} files in this process")
+                yield from _parse_files_serially(graph, chunk)
+                continue
+            for path, error in failed:
+                logger.warning(f"Failed to parse {path}: {error}")
+            for path, subject, triple_count, content in parsed:
+                yield path, URIRef(subject) if subject else None, triple_count, content
+
+
+def _parse_files_serially(
+    graph: Graph, paths: List[Path]
+) -> Iterator[Tuple[Path, Optional[URIRef], int, str]]:
+    """Parse files into graph in this process, as for _parse_files_into."""
+    for path in paths:
+        try:
+            subject_uri, triple_count, content = _DEFAULT_PARSER._parse_file_into(path, graph)
+        except Exception as e:
+            logger.warning(f"Failed to parse {path}: {e}")
+            continue
+        yield path, subject_uri, triple_count, content
+
+
+def scan_workspace_graph(
+    workspace_path: Union[str, Path],
+    patterns: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
+) -> Graph:
     """
     Scan a workspace and build a unified knowledge graph from all Yurtle files.
 
     Args:
         workspace_path: Root of the workspace
         patterns: Glob patterns to match (default: ['**/*.md'])
+        max_workers: Worker processes for parsing (default: None, parse in
+            this process; see _parse_files_into)
 
     Returns:
         A unified Graph containing all triples from all files
@@ -371,28 +1255,20 @@ def scan_workspace_graph(workspace_path: Union[str, Path], patterns: Optional[Li
     if patterns is None:
         patterns = ['**/*.md']
 
-    parser = YurtleParser()
     unified_graph = Graph()
 
     # Bind standard prefixes
-    for prefix, ns in parser.STANDARD_PREFIXES.items():
-        unified_graph.bind(prefix, ns)
+    _bind_unbound(unified_graph, YurtleParser.STANDARD_PREFIXES.items())
 
     files_parsed = 0
-    triples_added = 0
-
-    for pattern in patterns:
-        for path in workspace_path.glob(pattern):
-            if path.is_file() and not path.name.startswith('.'):
-                try:
-                    doc = parser.parse_file(path)
-                    if doc.graph:
-                        initial_size = len(unified_graph)
-                        unified_graph += doc.graph
-                        triples_added += len(unified_graph) - initial_size
-                        files_parsed += 1
-                except Exception as e:
-                    logger.warning(f"Failed to parse {path}: {e}")
+    # Triples new to the graph; ones repeated across files count once
+    initial_size = len(unified_graph)
+
+    paths = _collect_workspace_files(workspace_path, patterns)
+    for _path, _subject_uri, triple_count, _content in _parse_files_into(unified_graph, paths, max_workers):
+        if triple_count:
+            files_parsed += 1
+    triples_added = len(unified_graph) - initial_size
 
     logger.info(f"Scanned {files_parsed} files, extracted {triples_added} triples")
     return unified_graph
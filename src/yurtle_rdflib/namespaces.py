@@ -28,6 +28,10 @@ KNOWLEDGE = Namespace("https://yurtle.dev/knowledge/")
 # Provenance namespace (for tracking source files)
 PROVENANCE = Namespace("https://yurtle.dev/provenance/")
 
+# Provenance predicate, built once: Namespace attribute access creates a
+# new URIRef on every lookup
+_DEFINED_IN = PROVENANCE.definedIn
+
 # All namespaces as a dict for easy binding
 STANDARD_NAMESPACES = {
     'yurtle': YURTLE,
@@ -39,6 +43,26 @@ STANDARD_NAMESPACES = {
 }
 
 
+def _bind_unbound(graph, namespaces):
+    """
+    Bind (prefix, namespace) pairs to a graph, skipping ones already bound.
+
+    Equivalent to calling graph.bind() for each pair, but a prefix already
+    mapped to the same namespace (rdflib binds rdf, rdfs, xsd, ... on every
+    new graph) costs a store lookup instead of a NamespaceManager.bind().
+
+    Args:
+        graph: RDFlib Graph to bind namespaces to
+        namespaces: Iterable of (prefix, namespace) pairs
+    """
+    manager = graph.namespace_manager
+    store = graph.store
+    for prefix, ns in namespaces:
+        bound = store.namespace(prefix)
+        if bound is None or str(bound) != str(ns):
+            manager.bind(prefix, ns)
+
+
 def bind_standard_namespaces(graph):
     """
     Bind all standard Yurtle namespaces to a graph.
@@ -48,10 +72,7 @@ def bind_standard_namespaces(graph):
     """
     from rdflib.namespace import RDF, RDFS, XSD
 
-    for prefix, ns in STANDARD_NAMESPACES.items():
-        graph.bind(prefix, ns)
+    _bind_unbound(graph, STANDARD_NAMESPACES.items())
 
     # Also bind standard RDF namespaces
-    graph.bind('rdf', RDF)
-    graph.bind('rdfs', RDFS)
-    graph.bind('xsd', XSD)
+    _bind_unbound(graph, (('rdf', RDF), ('rdfs', RDFS), ('xsd', XSD)))
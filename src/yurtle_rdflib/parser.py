@@ -23,15 +23,18 @@ License: MIT
 """
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO, StringIO
 from pathlib import Path
-from typing import IO, Optional, Union
+from typing import IO, Iterable, Optional, Tuple, Union
 
 from rdflib import Graph, URIRef, Namespace
 from rdflib.parser import Parser
 from rdflib.plugin import register
 
-from .core import YurtleParser as CoreYurtleParser
+from .core import YurtleDocument, YurtleParser as CoreYurtleParser, _DEFAULT_PARSER, _read_text, _real_dir, _real_path
+from .namespaces import _DEFINED_IN
 
 logger = logging.getLogger(__name__)
 
@@ -60,7 +63,9 @@ class YurtleRDFlibParser(Parser):
     def __init__(self):
         """Initialize the parser."""
         super().__init__()
-        self._core_parser = CoreYurtleParser()
+        # rdflib creates a parser per Graph.parse() call; share the core
+        # parser (and its YAML schema cache) instead of building one each time
+        self._core_parser: CoreYurtleParser = _DEFAULT_PARSER
 
     def parse(
         self,
@@ -87,29 +92,90 @@ class YurtleRDFlibParser(Parser):
         - An InputSource with a stream
         """
         add_provenance = kwargs.get('provenance', True)
+        # A single document is its own batch for the directory cache
+        _real_dir.cache_clear()
+        doc, source_path = self._parse_source(source, encoding)
+        self._add_document(sink, doc, source_path, add_provenance)
 
+    def parse_many(
+        self,
+        sources: Iterable,
+        sink: Graph,
+        encoding: str = "utf-8",
+        provenance: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Parse several Yurtle documents into an RDFlib graph.
+
+        Sources are read and parsed in a thread pool, overlapping file I/O
+        across documents; their triples are added to the sink on the calling
+        thread in source order, as rdflib stores aren't safe for concurrent
+        writes.
+
+        Args:
+            sources: Sources accepted by parse() (paths, InputSources, ...)
+            sink: Graph to add triples to
+            encoding: Character encoding (default: utf-8)
+            provenance: If True, add definedIn triples (default: True)
+            max_workers: Worker thread count (default: ThreadPoolExecutor's)
+        """
+        sources = list(sources)
+        # Directory symlinks may have been re-pointed since the last batch;
+        # documents in this one share each directory's resolution
+        _real_dir.cache_clear()
+        if len(sources) < 2 or max_workers == 1:
+            for source in sources:
+                doc, source_path = self._parse_source(source, encoding)
+                self._add_document(sink, doc, source_path, provenance)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._parse_source, source, encoding) for source in sources]
+            for future in futures:
+                doc, source_path = future.result()
+                self._add_document(sink, doc, source_path, provenance)
+
+    def _parse_source(self, source, encoding: str) -> Tuple[YurtleDocument, Optional[Path]]:
+        """Read and parse one source, returning the document and its path."""
         # Extract content from source
         content = self._get_content(source, encoding)
 
-        # Get source path for provenance
+        # Get source path for provenance (and subject URIs: documents
+        # without a subject are named after the file, so this is needed
+        # even when provenance is off)
         source_path = self._get_source_path(source)
 
         # Parse using core parser
-        doc = self._core_parser.parse(content, source_path)
+        return self._core_parser.parse(content, source_path), source_path
 
-        # Add all triples to sink
-        for triple in doc.graph:
-            sink.add(triple)
+    def _add_document(
+        self,
+        sink: Graph,
+        doc: YurtleDocument,
+        source_path: Optional[Path],
+        add_provenance: bool,
+    ) -> None:
+        """Add a parsed document's triples (and provenance) to the sink."""
+        # Add all triples to sink in one batch. Triples the sink already
+        # holds are skipped (an index lookup), so stores that do work per
+        # add(), like YurtleStore marking files dirty, aren't touched
+        # needlessly when a document is parsed again.
+        if len(sink):
+            sink.addN((s, p, o, sink) for s, p, o in doc.graph if (s, p, o) not in sink)
+        else:
+            sink.addN((s, p, o, sink) for s, p, o in doc.graph)
 
         # Add provenance triple if requested and we have both subject and path
         if add_provenance and doc.subject_uri and source_path:
-            file_uri = URIRef(f"file://{source_path.resolve()}")
-            sink.add((doc.subject_uri, PROVENANCE.definedIn, file_uri))
+            file_uri = URIRef(f"file://{_real_path(source_path)}")
+            sink.add((doc.subject_uri, _DEFINED_IN, file_uri))
 
-        logger.debug(
-            f"Parsed {source_path or 'stream'}: "
-            f"{len(doc.graph)} triples, subject={doc.subject_uri}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Parsed {source_path or 'stream'}: "
+                f"{len(doc.graph)} triples, subject={doc.subject_uri}"
+            )
 
     def _get_content(self, source, encoding: str) -> str:
         """Extract text content from various source types."""
@@ -134,15 +200,13 @@ class YurtleRDFlibParser(Parser):
                 # Handle file:// URIs
                 if system_id.startswith('file://'):
                     system_id = system_id[7:]
-                path = Path(system_id)
-                if path.exists():
-                    return path.read_text(encoding=encoding)
+                if os.path.isfile(system_id):
+                    return _read_text(system_id, encoding)
 
         # Source might be a file path directly
         if isinstance(source, (str, Path)):
-            path = Path(source)
-            if path.exists():
-                return path.read_text(encoding=encoding)
+            if os.path.isfile(source):
+                return _read_text(source, encoding)
 
         raise ValueError(f"Cannot extract content from source: {type(source)}")
 
@@ -157,7 +221,9 @@ class YurtleRDFlibParser(Parser):
                 return Path(system_id)
 
         # Direct path
-        if isinstance(source, (str, Path)):
+        if isinstance(source, Path):
+            return source
+        if isinstance(source, str):
             return Path(source)
 
         return None
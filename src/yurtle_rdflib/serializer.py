@@ -30,21 +30,73 @@ ROUND-TRIP PRESERVATION:
 License: MIT
 """
 
+import codecs
 import logging
-import re
 from io import BytesIO, StringIO
 from pathlib import Path
-from typing import IO, Optional, Union
+from typing import IO, Optional, Set, Tuple, Union
 
 from rdflib import Graph, URIRef, Literal, BNode, Namespace
 from rdflib.serializer import Serializer
 from rdflib.plugin import register
 from rdflib.namespace import RDF, RDFS, XSD
 
-from .namespaces import YURTLE, PM, BEING, PROVENANCE
+from .core import _read_text, _split_frontmatter
+from .namespaces import YURTLE, PM, BEING, _DEFINED_IN
 
 logger = logging.getLogger(__name__)
 
+# Object prefix marking provenance file URIs
+_FILE_PREFIX = 'file://'
+
+# Standard prefixes bound for Turtle output if not already bound
+_PREFIXES_TO_BIND = (
+    ('yurtle', YURTLE),
+    ('pm', PM),
+    ('being', BEING),
+    ('rdf', RDF),
+    ('rdfs', RDFS),
+    ('xsd', XSD),
+)
+
+
+class _ProvenanceFilteredGraph(Graph):
+    """
+    Read-only view of a graph that hides provenance triples.
+
+    Triple lookups are answered by the source graph and filtered as they
+    are yielded. The view's own (empty) store only holds its namespace
+    bindings, so binding output prefixes never touches the source graph.
+    """
+
+    def __init__(self, source: Graph):
+        super().__init__()
+        self._source = source
+
+    def triples(self, triple):
+        """Yield the source graph's matching triples, minus provenance."""
+        predicate = triple[1]
+        if type(predicate) is URIRef and predicate == _DEFINED_IN:
+            return
+        check_predicate = predicate is None
+
+        # Locals for the per-triple checks (URIRef is a str, so startswith
+        # runs directly in C)
+        uri_ref = URIRef
+        file_prefix = _FILE_PREFIX
+        for found in self._source.triples(triple):
+            # Skip file:// URIs in object position (also provenance)
+            obj = found[2]
+            if type(obj) is uri_ref and obj.startswith(file_prefix):
+                continue
+            # Skip definedIn provenance triples
+            if check_predicate and found[1] == _DEFINED_IN:
+                continue
+            yield found
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.triples((None, None, None)))
+
 
 class YurtleRDFlibSerializer(Serializer):
     """
@@ -103,73 +155,90 @@ class YurtleRDFlibSerializer(Serializer):
             markdown_content = self._extract_markdown_from_file(preserve_path)
 
         # Create a filtered graph without provenance triples
-        filtered_graph = self._filter_provenance_triples()
-
-        # Serialize the filtered graph to Turtle
-        turtle_content = self._serialize_to_turtle(filtered_graph)
-
-        # Build Yurtle output
-        output = self._build_yurtle_output(turtle_content, markdown_content)
+        filtered_graph, bound_namespaces = self._filter_provenance_triples()
 
         # Write to stream (always as bytes for RDFlib compatibility)
         actual_encoding = encoding if encoding else 'utf-8'
-        stream.write(output.encode(actual_encoding))
 
-    def _filter_provenance_triples(self) -> Graph:
+        # Serialize the filtered graph to Turtle. For UTF-8, rdflib's bytes
+        # are written as they are rather than decoded and encoded again.
+        utf8 = codecs.lookup(actual_encoding).name == 'utf-8'
+        turtle = self._serialize_to_turtle(
+            filtered_graph, encoding='utf-8' if utf8 else None, bound_namespaces=bound_namespaces
+        )
+
+        # Write the Yurtle document piece by piece; the incremental encoder
+        # emits a BOM (for encodings that have one) only once
+        encode = codecs.getincrementalencoder(actual_encoding)().encode
+        stream.write(encode("---\n"))
+        turtle = turtle.strip()
+        stream.write(turtle if isinstance(turtle, bytes) else encode(turtle))
+        stream.write(encode("\n---\n"))
+        if markdown_content:
+            # Empty line between frontmatter and content
+            stream.write(encode("\n"))
+            stream.write(encode(markdown_content.lstrip('\n')))
+        stream.write(encode("", final=True))
+
+    def _filter_provenance_triples(self) -> Tuple[Graph, Set[str]]:
         """
-        Create a copy of the graph without provenance triples.
+        Return a view of the graph without provenance triples.
 
         Provenance triples (definedIn) are used internally for tracking
         source files but should not be serialized back to Yurtle files.
+        They are filtered out as the Turtle serializer reads the view, so
+        the graph is never copied.
 
         Returns:
-            New Graph with provenance triples removed
+            (graph view with provenance triples hidden, namespaces copied
+            to it under a non-"_" prefix)
         """
-        filtered = Graph()
+        filtered = _ProvenanceFilteredGraph(self.store)
 
-        # Copy namespace bindings
+        # Copy namespace bindings, noting what's bound along the way
+        bound = set()
         for prefix, namespace in self.store.namespaces():
             filtered.bind(prefix, namespace)
+            if not prefix.startswith('_'):
+                bound.add(str(namespace))
 
-        # Copy all triples except provenance
-        for s, p, o in self.store:
-            # Skip definedIn provenance triples
-            if p == PROVENANCE.definedIn:
-                continue
-            # Skip file:// URIs in object position (also provenance)
-            if isinstance(o, URIRef) and str(o).startswith('file://'):
-                continue
-            filtered.add((s, p, o))
-
-        return filtered
+        return filtered, bound
 
-    def _serialize_to_turtle(self, graph: Graph) -> str:
+    def _serialize_to_turtle(
+        self,
+        graph: Graph,
+        encoding: Optional[str] = None,
+        bound_namespaces: Optional[Set[str]] = None,
+    ) -> Union[str, bytes]:
         """
         Serialize a graph to Turtle format.
 
         Args:
             graph: Graph to serialize
+            encoding: Return encoded bytes instead of a string
+            bound_namespaces: Namespaces known to be bound to the graph
+                already (read from the graph if not given)
 
         Returns:
-            Turtle-formatted string
+            Turtle-formatted string, or bytes if encoding is given
         """
         # Bind standard prefixes if not already bound
-        prefixes_to_bind = [
-            ('yurtle', YURTLE),
-            ('pm', PM),
-            ('being', BEING),
-            ('rdf', RDF),
-            ('rdfs', RDFS),
-            ('xsd', XSD),
-        ]
-
-        for prefix, ns in prefixes_to_bind:
-            try:
-                graph.bind(prefix, ns, override=False)
-            except Exception:
-                pass  # Prefix already bound
+        # bind(override=False) leaves a namespace that already has a (non
+        # "_"-generated) prefix alone, so only bind the others
+        if bound_namespaces is None:
+            bound_namespaces = {
+                str(ns) for prefix, ns in graph.namespaces() if not prefix.startswith('_')
+            }
+        # Bound through the NamespaceManager (not store.bind), which also
+        # indexes the namespace for qname lookups during serialization
+        manager = graph.namespace_manager
+        for prefix, ns in _PREFIXES_TO_BIND:
+            if str(ns) not in bound_namespaces:
+                manager.bind(prefix, ns, override=False)
 
         # Serialize to Turtle
+        if encoding:
+            return graph.serialize(format='turtle', encoding=encoding)
         turtle_bytes = graph.serialize(format='turtle')
 
         # Handle bytes vs string return (depends on rdflib version)
@@ -177,35 +246,6 @@ class YurtleRDFlibSerializer(Serializer):
             return turtle_bytes.decode('utf-8')
         return turtle_bytes
 
-    def _build_yurtle_output(
-        self,
-        turtle_content: str,
-        markdown_content: str = ""
-    ) -> str:
-        """
-        Build the final Yurtle output with frontmatter and markdown.
-
-        Args:
-            turtle_content: Turtle-formatted RDF content
-            markdown_content: Optional markdown content
-
-        Returns:
-            Complete Yurtle document string
-        """
-        # Clean up Turtle content (remove trailing whitespace)
-        turtle_content = turtle_content.strip()
-
-        # Build output
-        parts = ["---", turtle_content, "---"]
-
-        if markdown_content:
-            # Ensure markdown starts on new line after frontmatter
-            markdown_content = markdown_content.lstrip('\n')
-            parts.append("")  # Empty line between frontmatter and content
-            parts.append(markdown_content)
-
-        return "\n".join(parts)
-
     def _extract_markdown_from_file(self, file_path: Union[str, Path]) -> str:
         """
         Extract markdown content from an existing Yurtle file.
@@ -224,17 +264,13 @@ class YurtleRDFlibSerializer(Serializer):
             return ""
 
         try:
-            content = path.read_text(encoding='utf-8')
-
-            # Extract content after frontmatter
-            frontmatter_pattern = re.compile(
-                r'^---\s*\n.*?\n---\s*\n(.*)$',
-                re.DOTALL
-            )
+            content = _read_text(path)
 
-            match = frontmatter_pattern.match(content)
-            if match:
-                return match.group(1)
+            # Extract content after frontmatter (str.find split, no regex
+            # for the usual layout)
+            split = _split_frontmatter(content)
+            if split is not None:
+                return split[1]
 
             # No frontmatter - return entire content
             return content
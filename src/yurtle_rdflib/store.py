@@ -37,11 +37,13 @@ License: MIT
 import hashlib
 import json
 import logging
+import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Any, Iterator, Tuple, Generator, Set, List
+from typing import Callable, Dict, FrozenSet, Optional, Any, Iterable, Iterator, Tuple, Generator, Set, List
 from dataclasses import dataclass
-from datetime import datetime
 
 from rdflib import Graph, URIRef, Literal, BNode, Namespace
 from rdflib.store import Store
@@ -55,8 +57,37 @@ from .core import (
     YURTLE,
     PM,
     BEING,
+    _atomic_write,
+    _collect_workspace_files,
+    _fsync_directory,
+    _read_document,
+    _real_dir,
+    _real_path,
+    _Triples,
+    _uri,
 )
-from .namespaces import PROVENANCE
+from .namespaces import PROVENANCE, _DEFINED_IN
+
+try:
+    # SIMD-accelerated hashing when available
+    from blake3 import blake3 as _file_hasher
+except ImportError:  # pragma: no cover - depends on environment
+    _file_hasher = hashlib.blake2b
+
+
+def _stdlib_json_dumps(data: Any) -> bytes:
+    """Encode the index with the standard library, compactly like orjson."""
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+_json_dumps: Callable[[Any], bytes]
+_json_loads: Callable[[bytes], Any]
+try:
+    # C JSON codec for the index, when available
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:  # pragma: no cover - depends on environment
+    _json_dumps = _stdlib_json_dumps
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
@@ -70,7 +101,12 @@ class FileState:
     triple_count: int
     subject_uri: Optional[URIRef] = None
     is_dirty: bool = False
-    markdown_content: str = ""  # Preserved for round-trip
+    # Preserved for round-trip; None until read (it isn't kept in the index)
+    markdown_content: Optional[str] = None
+    # os.stat() fingerprint of the hashed contents (0 = unknown, hash to check)
+    size: int = 0
+    mtime_ns: int = 0
+    inode: int = 0
 
 
 class YurtleStore(Store):
@@ -98,6 +134,19 @@ class YurtleStore(Store):
     formula_aware = False
     transaction_aware = False
 
+    # Files modified this recently when stat'ed may change again without
+    # their mtime moving (coarse timestamps), so their stat isn't trusted
+    RACY_WINDOW_NS = 2_000_000_000
+
+    # Hash and parse in a thread pool when at least this many files changed
+    PARALLEL_SYNC_THRESHOLD = 4
+
+    # Read size for hashing files
+    HASH_BLOCK_SIZE = 1 << 16
+
+    # Index format; 2.0 stores "updated" as epoch seconds (was ISO 8601)
+    INDEX_VERSION = "2.0"
+
     def __init__(
         self,
         root_dir: str,
@@ -105,6 +154,8 @@ class YurtleStore(Store):
         identifier: Optional[str] = None,
         patterns: Optional[List[str]] = None,
         auto_flush: bool = False,
+        backend: str = "default",
+        watch: bool = False,
     ):
         """
         Initialize YurtleStore.
@@ -115,25 +166,48 @@ class YurtleStore(Store):
             identifier: Store identifier
             patterns: Glob patterns to match (default: ['**/*.md'])
             auto_flush: If True, flush changes immediately after each add/remove
+            backend: RDFlib store plugin holding the in-memory graph
+                (default: rdflib's Memory store). For very large workspaces,
+                "Oxigraph" (from the oxrdflib package) keeps triples in
+                Rust-backed indexes; each term still crosses into Python
+                per call, so it pays off for pattern lookups and SPARQL
+                rather than single-triple adds.
+            watch: If True, watch root_dir for changes (needs the watchdog
+                package) so query() only syncs after the filesystem changed,
+                instead of rescanning the workspace on every call
         """
         super().__init__(configuration, identifier)
 
         self.root_dir = Path(root_dir)
         self.patterns = patterns or ["**/*.md"]
         self.auto_flush = auto_flush
+        self.backend = backend
 
         # Internal state
-        self.internal_graph = Graph()
+        self.internal_graph = Graph(store=backend)
         self.file_states: Dict[Path, FileState] = {}
         self.parser = YurtleParser()
         self.writer = YurtleWriter()
         self._dirty_files: Set[Path] = set()
+        # Files whose triples are in internal_graph; states restored from
+        # the index alone (a new store) still need reading once
+        self._read_files: Set[Path] = set()
+        # Source file of each subject with definedIn provenance, so add()
+        # doesn't query the graph for it on every triple
+        self._subject_to_path: Dict[URIRef, Path] = {}
+        # file:// URI of each path, resolved once per path
+        self._file_uris: Dict[Path, URIRef] = {}
+        # Last Turtle frontmatter flushed per subject, with the triples and
+        # namespace bindings it was serialized from
+        self._frontmatter_cache: Dict[URIRef, Tuple[FrozenSet, Tuple, bytes]] = {}
 
         # Bind common namespaces
         self.internal_graph.bind("prov", PROVENANCE)
         self.internal_graph.bind("yurtle", YURTLE)
         self.internal_graph.bind("pm", PM)
         self.internal_graph.bind("being", BEING)
+        # The internal graph's bindings as of the last flush; bind() resets it
+        self._ns_snapshot: Optional[Tuple[Tuple[str, URIRef], ...]] = None
 
         # Index file path
         self._index_path = self.root_dir / ".yurtle-store-index.json"
@@ -141,6 +215,13 @@ class YurtleStore(Store):
         # Load existing index
         self._load_index()
 
+        # Filesystem watcher (started before the initial sync, so changes
+        # made while it runs are seen)
+        self._observer = None
+        self._fs_changed = True
+        if watch:
+            self._start_watching()
+
         # Initial sync from filesystem
         self.sync()
 
@@ -159,8 +240,8 @@ class YurtleStore(Store):
             return
 
         try:
-            with open(self._index_path) as f:
-                data = json.load(f)
+            with open(self._index_path, "rb") as f:
+                data = _json_loads(f.read())
 
             for path_str, state_data in data.get("files", {}).items():
                 path = Path(path_str)
@@ -169,8 +250,10 @@ class YurtleStore(Store):
                     hash=state_data["hash"],
                     last_modified=state_data["last_modified"],
                     triple_count=state_data["triple_count"],
-                    subject_uri=URIRef(state_data["subject_uri"]) if state_data.get("subject_uri") else None,
-                    markdown_content=state_data.get("markdown_content", ""),
+                    subject_uri=_uri(state_data["subject_uri"]) if state_data.get("subject_uri") else None,
+                    size=state_data.get("size", 0),
+                    mtime_ns=state_data.get("mtime_ns", 0),
+                    inode=state_data.get("inode", 0),
                 )
 
             logger.debug(f"Loaded index with {len(self.file_states)} entries")
@@ -183,8 +266,8 @@ class YurtleStore(Store):
         """Persist file state index to disk."""
         try:
             data = {
-                "version": "1.0",
-                "updated": datetime.now().isoformat(),
+                "version": self.INDEX_VERSION,
+                "updated": time.time(),  # Epoch seconds, like last_modified
                 "root_dir": str(self.root_dir),
                 "files": {
                     str(path): {
@@ -192,14 +275,18 @@ class YurtleStore(Store):
                         "last_modified": state.last_modified,
                         "triple_count": state.triple_count,
                         "subject_uri": str(state.subject_uri) if state.subject_uri else None,
-                        "markdown_content": state.markdown_content,
+                        "size": state.size,
+                        "mtime_ns": state.mtime_ns,
+                        "inode": state.inode,
                     }
                     for path, state in self.file_states.items()
                 },
             }
 
-            with open(self._index_path, "w") as f:
-                json.dump(data, f, indent=2)
+            # Compact JSON; markdown bodies are not stored, so the index
+            # stays small and is cheap to rewrite on every save
+            with _atomic_write(self._index_path) as f:
+                f.write(_json_dumps(data))
 
             logger.debug(f"Saved index with {len(self.file_states)} entries")
 
@@ -211,17 +298,52 @@ class YurtleStore(Store):
     # =========================================================================
 
     def _compute_file_hash(self, path: Path) -> str:
-        """Compute MD5 hash of file contents."""
+        """
+        Compute a hash of file contents.
+
+        The file is read in blocks into one reused buffer and hashed
+        (BLAKE3 if the blake3 package is installed, BLAKE2b otherwise).
+        Workspace files are edited by other processes, so they aren't
+        mmapped: a file truncated while mapped raises SIGBUS on access,
+        which kills the interpreter instead of failing this hash.
+        """
         try:
-            content = path.read_bytes()
-            return hashlib.md5(content).hexdigest()
+            hasher = _file_hasher()
+            buffer = bytearray(self.HASH_BLOCK_SIZE)
+            view = memoryview(buffer)
+            with open(path, "rb", buffering=0) as f:
+                while True:
+                    n = f.readinto(buffer)
+                    if not n:
+                        break
+                    hasher.update(view[:n])
+            digest: str = hasher.hexdigest()
+            return digest
         except Exception as e:
             logger.warning(f"Failed to hash {path}: {e}")
             return ""
 
+    def _record_stat(self, state: FileState, st: os.stat_result) -> None:
+        """
+        Remember a file's stat fingerprint for the hash just stored.
+
+        A file modified within RACY_WINDOW_NS of now is left unrecorded, so
+        the next sync hashes it rather than trusting an mtime that a quick
+        follow-up write could leave unchanged.
+        """
+        if time.time_ns() - st.st_mtime_ns < self.RACY_WINDOW_NS:
+            state.size = state.mtime_ns = state.inode = 0
+        else:
+            state.size = st.st_size
+            state.mtime_ns = st.st_mtime_ns
+            state.inode = st.st_ino
+
     def _file_uri(self, path: Path) -> URIRef:
-        """Convert a file path to a file:// URI."""
-        return URIRef(f"file://{path.resolve()}")
+        """Convert a file path to a file:// URI (memoized until the file is removed)."""
+        file_uri = self._file_uris.get(path)
+        if file_uri is None:
+            file_uri = self._file_uris[path] = URIRef(f"file://{_real_path(path)}")
+        return file_uri
 
     def _uri_to_path(self, uri: URIRef) -> Optional[Path]:
         """Convert a file:// URI back to a Path."""
@@ -230,6 +352,49 @@ class YurtleStore(Store):
             return Path(uri_str[7:])
         return None
 
+    # =========================================================================
+    # Filesystem Watching
+    # =========================================================================
+
+    def _start_watching(self) -> None:
+        """Start a watchdog observer that flags filesystem changes under root_dir."""
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            logger.warning("watch=True needs the watchdog package; query() will sync on every call")
+            return
+
+        store = self
+
+        class _ChangeHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                store._mark_stale(event)
+
+        observer = Observer()
+        observer.schedule(_ChangeHandler(), str(self.root_dir), recursive=True)
+        observer.daemon = True
+        observer.start()
+        self._observer = observer
+
+    def _mark_stale(self, event: Any) -> None:
+        """
+        Record a filesystem event from the watcher thread.
+
+        Events only for hidden files (the index, atomic-write temporaries)
+        are ignored; anything else makes the next query() sync. Only a flag
+        is set here, so no store state is touched off the caller's thread.
+        """
+        if getattr(event, "event_type", None) in ("opened", "closed", "closed_no_write"):
+            return
+        if event.is_directory:
+            self._fs_changed = True
+            return
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            if path and not os.path.basename(os.fsdecode(path)).startswith('.'):
+                self._fs_changed = True
+                return
+
     # =========================================================================
     # Synchronization
     # =========================================================================
@@ -239,90 +404,171 @@ class YurtleStore(Store):
         Synchronize internal graph with filesystem.
 
         Scans for new/modified/deleted files and updates the graph accordingly.
-        Uses hash-based change detection for efficiency.
+        Files whose (size, mtime, inode) match the index are skipped without
+        being read; the others are hashed, and only parsed if the hash
+        changed.
 
         Returns:
             Number of files that were re-synced
         """
+        # Changes the watcher reports from here on need another sync
+        self._fs_changed = False
+
         synced_count = 0
-        current_files: Set[Path] = set()
+        index_changed = False
 
-        # Scan all matching files
-        for pattern in self.patterns:
-            for path in self.root_dir.glob(pattern):
-                if path.is_file() and not path.name.startswith('.'):
-                    current_files.add(path)
+        # Directory symlinks may have been re-pointed since the last sync
+        _real_dir.cache_clear()
 
-        # Check for new/modified files
-        for path in current_files:
-            file_hash = self._compute_file_hash(path)
-            mtime = path.stat().st_mtime
+        # Scan all matching files (os.scandir walks, one stat per file below)
+        current_files: Set[Path] = set(_collect_workspace_files(self.root_dir, self.patterns))
 
-            existing = self.file_states.get(path)
+        # Files whose stat doesn't match the index need hashing
+        candidates: List[Tuple[Path, os.stat_result, Optional[FileState]]] = []
+        for path in list(current_files):
+            try:
+                st = os.stat(path)
+            except OSError:
+                # Removed since the scan; handled as deleted below
+                current_files.discard(path)
+                continue
+            if path not in self._read_files:
+                # Indexed but not read yet: the hash can't spare the parse
+                candidates.append((path, st, None))
+                continue
 
-            if existing and existing.hash == file_hash and not existing.is_dirty:
-                # File unchanged, skip
+            existing = self.file_states.get(path)
+            if existing and not existing.is_dirty and existing.mtime_ns:
+                if (existing.size == st.st_size and existing.mtime_ns == st.st_mtime_ns
+                        and existing.inode == st.st_ino):
+                    # Stat unchanged, skip without reading the file
+                    continue
+            candidates.append((path, st, existing))
+
+        # Hash each candidate, parsing it from the same read if changed.
+        # Hashing and file reads release the GIL, so they overlap across
+        # files in the pool; triples are then synced into the internal
+        # graph on this thread, as rdflib stores aren't safe for concurrent
+        # writes.
+        results = self._map_files(self._read_if_changed, candidates)
+        for (path, st, existing), (file_hash, changed, parsed) in zip(candidates, results):
+            if not changed:
+                # File unchanged (touched, or stat not trusted), skip; only
+                # candidates with a known state can hash unchanged
+                if existing is not None:
+                    self._record_stat(existing, st)
+                    index_changed = True
                 continue
 
             # File is new or modified - sync it
-            self._sync_file_read(path, file_hash, mtime)
+            if parsed is not None:
+                self._sync_file_read(path, file_hash, st, parsed)
+            else:
+                # Unparseable: drop the file's stale triples
+                self._remove_file_triples(path)
             synced_count += 1
 
-        # Check for deleted files
-        deleted_files = set(self.file_states.keys()) - current_files
-        for path in deleted_files:
+        # Check for deleted files (the keys view's difference is a new set,
+        # so removing states while iterating it is safe)
+        for path in self.file_states.keys() - current_files:
             self._remove_file(path)
             synced_count += 1
 
         # Save index if anything changed
-        if synced_count > 0:
+        if synced_count > 0 or index_changed:
             self._save_index()
 
         logger.info(f"Sync complete: {synced_count} files updated")
         return synced_count
 
-    def _sync_file_read(self, path: Path, file_hash: str, mtime: float) -> None:
-        """
-        Read a file and sync its triples to the internal graph.
+    def _map_files(self, func, items: List[Any]) -> List[Any]:
+        """Apply func to each item, in a thread pool for larger batches."""
+        if len(items) < self.PARALLEL_SYNC_THRESHOLD:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor() as executor:
+            return list(executor.map(func, items))
 
-        Args:
-            path: Path to the file
-            file_hash: Pre-computed MD5 hash
-            mtime: File modification time
+    def _read_if_changed(
+        self, candidate: Tuple[Path, os.stat_result, Optional[FileState]]
+    ) -> Tuple[str, bool, Optional[Tuple[Optional[URIRef], _Triples, str]]]:
         """
-        logger.debug(f"Reading file: {path}")
+        Hash a sync candidate and, if its contents changed, parse it.
 
-        # Remove old triples for this file
-        self._remove_file_triples(path)
+        The file is read once: the hash and the parser both use the same
+        bytes, so a changed file is read from disk only once. (It isn't
+        mmapped: another process truncating it while mapped would raise
+        SIGBUS and kill the interpreter.) Turtle frontmatter the fast
+        parser handles yields its triples without a per-file Graph.
+        Doesn't touch the internal graph, so it is safe to call from worker
+        threads.
+
+        Args:
+            candidate: (path, stat, known state or None to always parse)
 
-        # Parse the file
+        Returns:
+            (hash, changed, (subject_uri, triples, markdown_content) or None
+            if the file failed to parse)
+        """
+        path, _st, existing = candidate
+        known_hash = existing.hash if existing and not existing.is_dirty else None
         try:
-            doc = self.parser.parse_file(path)
+            with open(path, "rb") as f:
+                data = f.read()
+            hasher = _file_hasher()
+            hasher.update(data)
+            file_hash = hasher.hexdigest()
+            if file_hash == known_hash:
+                return file_hash, False, None
+            logger.debug(f"Reading file: {path}")
+            parsed = self.parser._parse_bytes_triples(data, path)
         except Exception as e:
             logger.warning(f"Failed to parse {path}: {e}")
-            return
+            return "", True, None
+        return file_hash, True, parsed
 
-        # Add triples to internal graph
-        triple_count = 0
-        for s, p, o in doc.graph:
-            self.internal_graph.add((s, p, o))
-            triple_count += 1
+    def _sync_file_read(
+        self,
+        path: Path,
+        file_hash: str,
+        st: os.stat_result,
+        parsed: Tuple[Optional[URIRef], _Triples, str],
+    ) -> None:
+        """
+        Sync a parsed file's triples to the internal graph.
 
-        # Add provenance triple
-        file_uri = self._file_uri(path)
-        if doc.subject_uri:
-            self.internal_graph.add((doc.subject_uri, PROVENANCE.definedIn, file_uri))
-            triple_count += 1
+        Args:
+            path: Path to the file
+            file_hash: Pre-computed content hash
+            st: File stat, taken before hashing
+            parsed: (subject_uri, triples, markdown_content), from
+                _read_if_changed()
+        """
+        subject_uri, triples, content = parsed
+
+        # Remove old triples for this file
+        self._remove_file_triples(path)
+
+        # Add triples to internal graph in one batch, provenance included
+        graph = self.internal_graph
+        quads = [(s, p, o, graph) for s, p, o in triples]
+        if subject_uri:
+            quads.append((subject_uri, _DEFINED_IN, self._file_uri(path), graph))
+            self._subject_to_path[subject_uri] = path
+        graph.addN(quads)
+        triple_count = len(quads)
 
         # Update file state
-        self.file_states[path] = FileState(
+        state = FileState(
             path=path,
             hash=file_hash,
-            last_modified=mtime,
+            last_modified=st.st_mtime,
             triple_count=triple_count,
-            subject_uri=doc.subject_uri,
-            markdown_content=doc.content,
+            subject_uri=subject_uri,
+            markdown_content=content,
         )
+        self._record_stat(state, st)
+        self.file_states[path] = state
+        self._read_files.add(path)
 
         logger.debug(f"Read {path}: {triple_count} triples")
 
@@ -332,24 +578,25 @@ class YurtleStore(Store):
         if path in self.file_states:
             del self.file_states[path]
         self._dirty_files.discard(path)
+        self._read_files.discard(path)
+        self._file_uris.pop(path, None)
         logger.debug(f"Removed file: {path}")
 
     def _remove_file_triples(self, path: Path) -> None:
         """Remove all triples associated with a file."""
         file_uri = self._file_uri(path)
 
-        # Find subjects defined in this file
-        subjects_to_remove = set()
-        for s in self.internal_graph.subjects(PROVENANCE.definedIn, file_uri):
-            subjects_to_remove.add(s)
+        # Find subjects defined in this file (one index lookup)
+        subjects_to_remove = set(self.internal_graph.subjects(_DEFINED_IN, file_uri))
 
-        # Remove all triples for those subjects
+        # Remove all triples for those subjects with one wildcard remove
+        # each; this takes their definedIn triples for the file too
+        remove = self.internal_graph.remove
         for subject in subjects_to_remove:
-            for p, o in list(self.internal_graph.predicate_objects(subject)):
-                self.internal_graph.remove((subject, p, o))
-
-        # Remove the definedIn triple itself
-        self.internal_graph.remove((None, PROVENANCE.definedIn, file_uri))
+            if isinstance(subject, URIRef):
+                self._subject_to_path.pop(subject, None)
+                self._frontmatter_cache.pop(subject, None)
+            remove((subject, None, None))
 
     # =========================================================================
     # Write-Back (Flush)
@@ -370,16 +617,24 @@ class YurtleStore(Store):
             return 0
 
         flushed_count = 0
+        directories = set()
         for path in list(self._dirty_files):
             try:
                 self._flush_file(path)
                 flushed_count += 1
+                directories.add(path.parent)
             except Exception as e:
                 logger.error(f"Failed to flush {path}: {e}")
 
         self._dirty_files.clear()
         self._save_index()
 
+        # Files are replaced by rename; make the renames durable with one
+        # fsync per directory rather than syncing each file as it's written
+        directories.add(self._index_path.parent)
+        for directory in directories:
+            _fsync_directory(directory)
+
         logger.info(f"Flushed {flushed_count} files")
         return flushed_count
 
@@ -397,44 +652,85 @@ class YurtleStore(Store):
             logger.warning(f"Cannot flush {path}: no state or subject URI")
             return
 
-        # Collect all triples for this subject
-        subject_graph = Graph()
-        for prefix, ns in self.internal_graph.namespaces():
-            subject_graph.bind(prefix, ns)
-
-        for p, o in self.internal_graph.predicate_objects(state.subject_uri):
-            # Skip provenance triples
-            if p == PROVENANCE.definedIn:
-                continue
-            subject_graph.add((state.subject_uri, p, o))
+        # Collect all triples for this subject (skipping provenance)
+        subject = state.subject_uri
+        triples = frozenset(
+            (subject, p, o)
+            for p, o in self.internal_graph.predicate_objects(subject)
+            if p != _DEFINED_IN
+        )
+        namespaces = self._namespace_snapshot()
+
+        # Turtle output depends only on the triple set and the prefixes, so
+        # a flush that changes neither (e.g. only the markdown, or a triple
+        # that was already present) reuses the last serialization. The
+        # snapshot already holds rdflib's defaults, so the subject graph
+        # starts without them instead of binding them twice.
+        subject_graph = Graph(bind_namespaces="none")
+        cached = self._frontmatter_cache.get(subject)
+        if cached is not None and cached[0] == triples and cached[1] == namespaces:
+            frontmatter = cached[2]
+        else:
+            for prefix, ns in namespaces:
+                subject_graph.bind(prefix, ns)
+            subject_graph.addN((s, p, o, subject_graph) for s, p, o in triples)
+            frontmatter = self.writer._serialize_turtle_bytes(subject_graph)
+            self._frontmatter_cache[subject] = (triples, namespaces, frontmatter)
 
         # Create YurtleDocument for serialization
         doc = YurtleDocument(
             graph=subject_graph,
-            content=state.markdown_content,
+            content=self._markdown_content(state),
             frontmatter_raw="",
             frontmatter_type="turtle",
             source_path=path,
-            subject_uri=state.subject_uri,
+            subject_uri=subject,
         )
 
         # Write to file
-        self.writer.write_file(doc, path)
+        self.writer.write_file(doc, path, frontmatter=frontmatter)
 
         # Update state
+        st = path.stat()
         state.hash = self._compute_file_hash(path)
-        state.last_modified = path.stat().st_mtime
-        state.triple_count = len(subject_graph)
+        state.last_modified = st.st_mtime
+        self._record_stat(state, st)
+        state.triple_count = len(triples)
         state.is_dirty = False
 
         logger.debug(f"Flushed {path}: {state.triple_count} triples")
 
+    def _namespace_snapshot(self) -> Tuple[Tuple[str, URIRef], ...]:
+        """
+        Return the internal graph's namespace bindings as a tuple.
+
+        Built once and reused by every flush until bind() changes them.
+        """
+        if self._ns_snapshot is None:
+            self._ns_snapshot = tuple(self.internal_graph.namespaces())
+        return self._ns_snapshot
+
+    def _markdown_content(self, state: FileState) -> str:
+        """
+        Return a file's markdown body, reading it from disk if not known yet.
+
+        States created by add() for files not read yet have no body in
+        memory; it is read from the file on first flush and kept on the state.
+        Read errors propagate rather than flushing the file without its body.
+        """
+        if state.markdown_content is None:
+            try:
+                state.markdown_content = _read_document(state.path)[1]
+            except FileNotFoundError:
+                state.markdown_content = ""
+        return state.markdown_content
+
     def _resolve_file_for_subject(self, subject: URIRef) -> Optional[Path]:
         """
         Resolve which file a subject should be stored in.
 
-        First checks if the subject has an existing definedIn provenance triple.
-        If not, uses the subject URI pattern to determine the target file.
+        First checks the subject-to-file map kept from sync, then any
+        definedIn provenance triple in the graph (caching what it finds).
 
         Args:
             subject: The subject URI
@@ -442,10 +738,15 @@ class YurtleStore(Store):
         Returns:
             Path to the target file, or None if cannot be resolved
         """
+        path = self._subject_to_path.get(subject)
+        if path is not None:
+            return path
+
         # Check existing provenance
-        for file_uri in self.internal_graph.objects(subject, PROVENANCE.definedIn):
+        for file_uri in self.internal_graph.objects(subject, _DEFINED_IN):
             path = self._uri_to_path(file_uri)
             if path:
+                self._subject_to_path[subject] = path
                 return path
 
         # Cannot resolve - return None
@@ -469,6 +770,10 @@ class YurtleStore(Store):
 
     def close(self, commit_pending_transaction: bool = False) -> None:
         """Close the store, flushing any pending changes."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
         if commit_pending_transaction or self._dirty_files:
             self.flush()
         self._save_index()
@@ -477,9 +782,14 @@ class YurtleStore(Store):
         """Destroy the store."""
         if self._index_path.exists():
             self._index_path.unlink()
-        self.internal_graph = Graph()
+        self.internal_graph = Graph(store=self.backend)
         self.file_states = {}
         self._dirty_files = set()
+        self._read_files = set()
+        self._subject_to_path = {}
+        self._file_uris = {}
+        self._frontmatter_cache = {}
+        self._ns_snapshot = None
 
     def add(
         self,
@@ -510,8 +820,8 @@ class YurtleStore(Store):
 
                 # Ensure provenance triple exists
                 file_uri = self._file_uri(target_file)
-                if (s, PROVENANCE.definedIn, file_uri) not in self.internal_graph:
-                    self.internal_graph.add((s, PROVENANCE.definedIn, file_uri))
+                if (s, _DEFINED_IN, file_uri) not in self.internal_graph:
+                    self.internal_graph.add((s, _DEFINED_IN, file_uri))
 
                 # Initialize file state if needed
                 if target_file not in self.file_states:
@@ -527,6 +837,28 @@ class YurtleStore(Store):
                 if self.auto_flush:
                     self._flush_file(target_file)
 
+    def addN(self, quads: Iterable[Tuple[Node, Node, Node, Any]]) -> None:
+        """
+        Add several triples, writing each affected file at most once.
+
+        Graph.addN() and graph += other land here. With auto_flush, the
+        files are flushed once after the whole batch instead of being
+        rewritten for every triple.
+
+        Args:
+            quads: (subject, predicate, object, context) tuples
+        """
+        auto_flush = self.auto_flush
+        self.auto_flush = False
+        try:
+            for s, p, o, context in quads:
+                self.add((s, p, o), context)
+        finally:
+            self.auto_flush = auto_flush
+
+        if auto_flush and self._dirty_files:
+            self.flush()
+
     def remove(
         self,
         triple: Tuple[Optional[Node], Optional[Node], Optional[Node]],
@@ -546,6 +878,9 @@ class YurtleStore(Store):
 
         for match_s, match_p, match_o in matching:
             self.internal_graph.remove((match_s, match_p, match_o))
+            if match_p == _DEFINED_IN and isinstance(match_s, URIRef):
+                # Provenance removed: resolve the subject from the graph again
+                self._subject_to_path.pop(match_s, None)
 
             # Mark affected file as dirty
             if isinstance(match_s, URIRef):
@@ -575,10 +910,44 @@ class YurtleStore(Store):
         for triple in self.internal_graph.triples((s, p, o)):
             yield triple, None
 
+    def triples_choices(self, triple: Tuple[Any, Any, Any], context: Any = None) -> Generator:
+        """
+        Yield triples matching a pattern where one position is a list of choices.
+
+        rdflib's SPARQL evaluation uses this for VALUES/IN-style bindings;
+        it's answered by the internal graph's own store (one indexed lookup
+        per choice) instead of the base Store's generic version.
+        """
+        for found in self.internal_graph.triples_choices(triple):
+            yield found, None
+
     def __len__(self, context: Any = None) -> int:
         """Return the number of triples in the store."""
         return len(self.internal_graph)
 
+    # Namespace bindings live on the internal graph, so prefixes bound
+    # through a Graph over this store are used when files are flushed
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        """Bind a prefix to a namespace."""
+        # Through the internal graph's NamespaceManager, which also indexes
+        # the namespace for its qname lookups; the calling Graph's manager
+        # has already picked the prefix, so take it as given
+        self.internal_graph.namespace_manager.bind(prefix, namespace, override=override, replace=True)
+        self._ns_snapshot = None
+
+    def namespace(self, prefix: str) -> Optional[URIRef]:
+        """Return the namespace bound to a prefix."""
+        return self.internal_graph.store.namespace(prefix)
+
+    def prefix(self, namespace: URIRef) -> Optional[str]:
+        """Return the prefix bound to a namespace."""
+        return self.internal_graph.store.prefix(namespace)
+
+    def namespaces(self) -> Iterator[Tuple[str, URIRef]]:
+        """Yield all (prefix, namespace) bindings."""
+        return self.internal_graph.store.namespaces()
+
     def __contains__(self, triple: Tuple[Node, Node, Node]) -> bool:
         """Check if a triple exists in the store."""
         return triple in self.internal_graph
@@ -596,6 +965,8 @@ class YurtleStore(Store):
         Execute a SPARQL query against the store.
 
         Syncs before querying to ensure results reflect latest file changes.
+        When the store watches its files, the sync is skipped unless the
+        watcher has seen a change since the last one.
 
         Args:
             query_string: SPARQL query
@@ -604,7 +975,8 @@ class YurtleStore(Store):
         Returns:
             Query results
         """
-        self.sync()
+        if self._observer is None or self._fs_changed:
+            self.sync()
         return self.internal_graph.query(query_string, **kwargs)
 
     def get_file_for_subject(self, subject_uri: URIRef) -> Optional[Path]:
@@ -621,6 +993,8 @@ class YurtleStore(Store):
             "root_dir": str(self.root_dir),
             "patterns": self.patterns,
             "auto_flush": self.auto_flush,
+            "backend": self.backend,
+            "watching": self._observer is not None,
             "total_files": len(self.file_states),
             "dirty_files": len(self._dirty_files),
             "total_triples": len(self.internal_graph),
@@ -635,6 +1009,8 @@ def create_yurtle_graph(
     root_dir: str,
     patterns: Optional[List[str]] = None,
     auto_flush: bool = False,
+    backend: str = "default",
+    watch: bool = False,
 ) -> Graph:
     """
     Create an RDFlib Graph backed by a YurtleStore.
@@ -645,6 +1021,8 @@ def create_yurtle_graph(
         root_dir: Root directory containing Yurtle files
         patterns: Glob patterns to match (default: ['**/*.md'])
         auto_flush: If True, flush changes immediately
+        backend: RDFlib store plugin for the in-memory graph (see YurtleStore)
+        watch: If True, sync on query only after file changes (needs watchdog)
 
     Returns:
         RDFlib Graph with YurtleStore backend
@@ -653,5 +1031,7 @@ def create_yurtle_graph(
         graph = create_yurtle_graph("/path/to/workspace", auto_flush=True)
         graph.add((subject, predicate, object))  # Persists immediately
     """
-    store = YurtleStore(root_dir=root_dir, patterns=patterns, auto_flush=auto_flush)
+    store = YurtleStore(
+        root_dir=root_dir, patterns=patterns, auto_flush=auto_flush, backend=backend, watch=watch
+    )
     return Graph(store=store)
@@ -2,6 +2,7 @@
 Shared pytest fixtures for yurtle-rdflib tests.
 """
 
+import copy
 import pytest
 from pathlib import Path
 import tempfile
@@ -25,7 +26,13 @@ def pm_ns():
     return yurtle_rdflib.PM
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def plugin_status():
+    """verify_plugins() result, checked once per session; don't modify it."""
+    return yurtle_rdflib.verify_plugins()
+
+
+@pytest.fixture(scope="session")
 def sample_turtle_doc():
     """Sample Yurtle document with Turtle frontmatter."""
     return '''---
@@ -48,6 +55,26 @@ A simple task used in tests.
 '''
 
 
+@pytest.fixture(scope="session")
+def sample_turtle_file(tmp_path_factory, sample_turtle_doc):
+    """sample_turtle_doc written to a file once per session; don't modify it."""
+    path = tmp_path_factory.mktemp("yurtle") / "test.md"
+    path.write_text(sample_turtle_doc)
+    return path
+
+
+@pytest.fixture(scope="session")
+def _parsed_sample_turtle_doc(sample_turtle_doc):
+    """sample_turtle_doc parsed once per session; use parsed_sample_turtle_doc."""
+    return yurtle_rdflib.YurtleParser().parse(sample_turtle_doc)
+
+
+@pytest.fixture
+def parsed_sample_turtle_doc(_parsed_sample_turtle_doc):
+    """A private copy of the parsed sample_turtle_doc."""
+    return copy.deepcopy(_parsed_sample_turtle_doc)
+
+
 @pytest.fixture
 def sample_yaml_doc():
     """Sample Yurtle document with YAML frontmatter."""
@@ -78,10 +105,8 @@ Just plain markdown content.
 '''
 
 
-@pytest.fixture
-def temp_workspace(tmp_path):
-    """Create a temporary workspace with sample files."""
-    workspace = tmp_path / "workspace"
+def _write_sample_workspace(workspace: Path) -> Path:
+    """Create workspace with the sample files."""
     workspace.mkdir()
 
     # Create sample files
@@ -130,15 +155,35 @@ A project file.
     return workspace
 
 
+@pytest.fixture
+def temp_workspace(tmp_path):
+    """Create a temporary workspace with sample files."""
+    return _write_sample_workspace(tmp_path / "workspace")
+
+
+@pytest.fixture(scope="session")
+def session_temp_workspace(tmp_path_factory):
+    """A sample workspace shared by the session; only for tests that don't modify it."""
+    return _write_sample_workspace(tmp_path_factory.mktemp("session") / "workspace")
+
+
+@pytest.fixture(scope="session")
+def session_yurtle_store(session_temp_workspace):
+    """A YurtleStore over session_temp_workspace; only for tests that don't modify it."""
+    store = yurtle_rdflib.YurtleStore(str(session_temp_workspace), auto_flush=False)
+    yield store
+    store.close()
+
+
 @pytest.fixture
 def empty_graph():
     """Return an empty RDFlib Graph."""
     return Graph()
 
 
-@pytest.fixture
-def sample_graph():
-    """Return a Graph with sample triples."""
+@pytest.fixture(scope="session")
+def _sample_graph():
+    """The sample graph, built once per session; use sample_graph."""
     graph = Graph()
     yurtle_rdflib.bind_standard_namespaces(graph)
 
@@ -148,3 +193,9 @@ def sample_graph():
     graph.add((subject, yurtle_rdflib.PM.priority, Literal(1)))
 
     return graph
+
+
+@pytest.fixture
+def sample_graph(_sample_graph):
+    """Return a Graph with sample triples (a private copy)."""
+    return copy.deepcopy(_sample_graph)
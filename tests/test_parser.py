@@ -9,17 +9,18 @@ from rdflib import Graph, URIRef, Literal
 import yurtle_rdflib
 from yurtle_rdflib import YurtleParser, YurtleDocument, YURTLE, PM
 
+TASK_T001 = URIRef("urn:task:T-001")
+
 
 class TestYurtleParser:
     """Tests for the core YurtleParser class."""
 
-    def test_parse_turtle_frontmatter(self, sample_turtle_doc):
+    def test_parse_turtle_frontmatter(self, parsed_sample_turtle_doc):
         """Test parsing a document with Turtle frontmatter."""
-        parser = YurtleParser()
-        doc = parser.parse(sample_turtle_doc)
+        doc = parsed_sample_turtle_doc
 
         assert doc.frontmatter_type == "turtle"
-        assert doc.subject_uri == URIRef("urn:task:T-001")
+        assert doc.subject_uri == TASK_T001
         assert len(doc.graph) >= 4  # At least 4 triples
 
         # Check title
@@ -39,6 +40,33 @@ class TestYurtleParser:
         assert doc.subject_uri is not None
         assert len(doc.graph) >= 1
 
+    def test_parse_yaml_schema_reuse(self, sample_yaml_doc):
+        """Test that documents sharing a YAML schema resolve the same predicates."""
+        parser = YurtleParser()
+        first = parser.parse(sample_yaml_doc)
+        second = parser.parse(sample_yaml_doc.replace("YAML Task", "Other Task"))
+
+        assert len(parser._yaml_schemas) == 1
+        assert set(first.graph.predicates()) == set(second.graph.predicates())
+        assert second.get_property(YURTLE.title) == "Other Task"
+
+    def test_parse_yaml_schema_types(self):
+        """Test that values and keys equal across bool and int keep their own types."""
+        from rdflib.namespace import XSD
+
+        parser = YurtleParser()
+        one = parser.parse("---\nx: 1\n---\n")
+        true = parser.parse("---\nx: true\n---\n")
+
+        assert next(one.graph.objects(None, YURTLE.x)).datatype == XSD.integer
+        assert next(true.graph.objects(None, YURTLE.x)).datatype == XSD.boolean
+
+        # 1 == True, but the two key sequences are cached separately
+        parser.parse("---\n1: a\n---\n")
+        parser.parse("---\ntrue: a\n---\n")
+        assert ((int, 1),) in parser._yaml_schemas
+        assert ((bool, True),) in parser._yaml_schemas
+
     def test_parse_no_frontmatter(self, sample_no_frontmatter):
         """Test parsing a document with no frontmatter."""
         parser = YurtleParser()
@@ -48,10 +76,9 @@ class TestYurtleParser:
         assert len(doc.graph) == 0
         assert "Plain Document" in doc.content
 
-    def test_parse_file(self, tmp_path, sample_turtle_doc):
+    def test_parse_file(self, sample_turtle_file):
         """Test parsing from a file."""
-        file_path = tmp_path / "test.md"
-        file_path.write_text(sample_turtle_doc)
+        file_path = sample_turtle_file
 
         parser = YurtleParser()
         doc = parser.parse_file(file_path)
@@ -59,18 +86,91 @@ class TestYurtleParser:
         assert doc.source_path == file_path
         assert doc.frontmatter_type == "turtle"
 
-    def test_content_preserved(self, sample_turtle_doc):
-        """Test that markdown content is preserved."""
+    def test_parse_file_matches_parse(self, tmp_path, sample_turtle_doc):
+        """Test that parse_file splits raw bytes the same way parse splits text."""
+        parser = YurtleParser()
+        texts = [
+            sample_turtle_doc,
+            "---\nid: café\n---\n\n# Ünïcode body\n",
+            "---\nid: a\n---　\n# Non-ASCII whitespace after close\n",
+            "---\r\nid: a\r\n---\r\n# CRLF\r\n",
+        ]
+        for i, text in enumerate(texts):
+            file_path = tmp_path / f"doc{i}.md"
+            file_path.write_bytes(text.encode("utf-8"))
+
+            doc = parser.parse_file(file_path)
+            expected = parser.parse(text.replace("\r\n", "\n"))
+            assert doc.frontmatter_raw == expected.frontmatter_raw
+            assert doc.content == expected.content
+
+    def test_parse_bytes_from_mmap(self, tmp_path, sample_turtle_doc):
+        """Test that parsing an mmap of a file matches parse_file."""
+        import mmap
+
         parser = YurtleParser()
-        doc = parser.parse(sample_turtle_doc)
+        for i, text in enumerate([sample_turtle_doc, "---\r\nid: a\r\n---\r\n# CRLF\r\n"]):
+            file_path = tmp_path / f"doc{i}.md"
+            file_path.write_bytes(text.encode("utf-8"))
+
+            expected = parser.parse_file(file_path)
+            with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                doc = parser.parse_bytes(mm, file_path)
+                subject_uri, triples, content = parser._parse_bytes_triples(mm, file_path)
+
+            assert doc.content == expected.content
+            assert set(doc.graph) == set(expected.graph)
+            assert doc.subject_uri == expected.subject_uri
+            assert (subject_uri, set(triples), content) == (doc.subject_uri, set(doc.graph), doc.content)
+
+    def test_parse_file_into_matches_parse_file(self, tmp_path, sample_turtle_doc, sample_yaml_doc):
+        """Test that parsing straight into a target graph matches parse_file."""
+        parser = YurtleParser()
+        texts = [
+            sample_turtle_doc,
+            sample_yaml_doc,
+            "---\n@prefix yurtle: <https://yurtle.dev/schema/> .\n---\n# Prefixes only\n",
+        ]
+        for i, text in enumerate(texts):
+            file_path = tmp_path / f"doc{i}.md"
+            file_path.write_text(text)
+
+            doc = parser.parse_file(file_path)
+            target = Graph()
+            subject_uri, triple_count, content = parser._parse_file_into(file_path, target)
+
+            assert subject_uri == doc.subject_uri
+            assert triple_count == len(doc.graph)
+            assert content == doc.content
+            assert set(target) == set(doc.graph)
+
+    def test_split_frontmatter_matches_pattern(self, sample_turtle_doc, sample_no_frontmatter):
+        """Test that the str.find frontmatter split agrees with the regex."""
+        from yurtle_rdflib.core import _split_frontmatter
+
+        texts = [
+            sample_turtle_doc,
+            sample_no_frontmatter,
+            "---\nid: a\n---\n\n\n# Blank lines\n",
+            "---  \n\nid: a\n---\t\n# Padded delimiters\n",
+            "---\nid: a\n----\nstill frontmatter\n---\n# Late close\n",
+            "---\nid: a\n",
+        ]
+        for text in texts:
+            match = YurtleParser.FRONTMATTER_PATTERN.match(text)
+            expected = (match.group(1), match.group(2)) if match else None
+            assert _split_frontmatter(text) == expected
+
+    def test_content_preserved(self, parsed_sample_turtle_doc):
+        """Test that markdown content is preserved."""
+        doc = parsed_sample_turtle_doc
 
         assert "# T-001: Test Task" in doc.content
         assert "This is a test task" in doc.content
 
-    def test_to_dict(self, sample_turtle_doc):
+    def test_to_dict(self, parsed_sample_turtle_doc):
         """Test converting graph to dictionary."""
-        parser = YurtleParser()
-        doc = parser.parse(sample_turtle_doc)
+        doc = parsed_sample_turtle_doc
 
         data = doc.to_dict()
         assert "title" in data
@@ -95,19 +195,96 @@ Content.
         assert "tag2" in tags
         assert "tag3" in tags
 
+    def test_turtle_fast_path_matches_rdflib(self):
+        """Test that flat Turtle handled by the fast path matches rdflib."""
+        frontmatter = '''@prefix yurtle: <https://yurtle.dev/schema/> .
+@prefix pm: <https://yurtle.dev/pm/> .
+
+<urn:task:T-010> a yurtle:WorkItem ;  # comment
+    yurtle:title "Fast Task"@en ;
+    yurtle:tag "a", "b" ;
+    pm:priority 2 ;
+    pm:estimate 1.5 ;
+    pm:blocked false .'''
+        parser = YurtleParser()
+        assert parser._parse_turtle_fast(frontmatter) is not None
+
+        doc = parser.parse(f"---\n{frontmatter}\n---\n# Fast\n")
+        expected = Graph().parse(data=frontmatter, format="turtle")
+
+        assert set(doc.graph) == set(expected)
+        assert doc.subject_uri == URIRef("urn:task:T-010")
+
+    @pytest.mark.parametrize("statement", [
+        "<urn:a> ex:p \u0663 .",  # Arabic-Indic digit
+        "<urn:a> ex:p\u00a0ex:o .",  # non-breaking space
+    ])
+    def test_turtle_fast_path_rejects_non_ascii_syntax(self, statement):
+        """Test that Unicode digits and whitespace are rejected like rdflib does."""
+        from rdflib.plugins.parsers.notation3 import BadSyntax
+
+        frontmatter = f"@prefix ex: <urn:ex:> .\n{statement}"
+        parser = YurtleParser()
+        assert parser._parse_turtle_fast(frontmatter) is None
+        with pytest.raises(BadSyntax):
+            Graph().parse(data=frontmatter, format="turtle")
+
+        doc = parser.parse(f"---\n{frontmatter}\n---\n# Bad\n")
+
+        assert len(doc.graph) == 0
+
+    def test_turtle_fast_path_shares_terms(self, sample_turtle_doc):
+        """Test that URIs repeated across documents are parsed to one object."""
+        parser = YurtleParser()
+        first = parser.parse(sample_turtle_doc)
+        second = parser.parse(sample_turtle_doc.replace("T-001", "T-002"))
+
+        first_predicates = {str(p): p for p in first.graph.predicates()}
+        for p in second.graph.predicates():
+            assert first_predicates[str(p)] is p
+
+    def test_turtle_fast_path_falls_back(self):
+        """Test that Turtle outside the fast-path subset uses rdflib."""
+        frontmatter = '''@prefix yurtle: <https://yurtle.dev/schema/> .
+
+<urn:task:T-011> yurtle:owner [ yurtle:name "Nested" ] .'''
+        parser = YurtleParser()
+        assert parser._parse_turtle_fast(frontmatter) is None
+
+        doc = parser.parse(f"---\n{frontmatter}\n---\n# Nested\n")
+
+        assert len(doc.graph) == 2
+        assert doc.subject_uri == URIRef("urn:task:T-011")
+
+    def test_turtle_fast_path_tried_once(self, monkeypatch):
+        """Test that Turtle the fast path rejects isn't tokenized again on fallback."""
+        frontmatter = '''@prefix yurtle: <https://yurtle.dev/schema/> .
+
+<urn:task:T-012> yurtle:owner [ yurtle:name "Nested" ] .'''
+        parser = YurtleParser()
+        calls = []
+        fast = parser._parse_turtle_fast
+        monkeypatch.setattr(parser, "_parse_turtle_fast", lambda fm: calls.append(fm) or fast(fm))
+
+        subject_uri, triples, _content = parser._parse_bytes_triples(
+            f"---\n{frontmatter}\n---\n# Nested\n".encode()
+        )
+
+        assert len(calls) == 1
+        assert len(triples) == 2
+        assert subject_uri == URIRef("urn:task:T-012")
+
 
 class TestYurtleRDFlibParser:
     """Tests for the RDFlib parser plugin."""
 
-    def test_plugin_registered(self):
+    def test_plugin_registered(self, plugin_status):
         """Test that the parser plugin is registered."""
-        status = yurtle_rdflib.verify_plugins()
-        assert status["parser"] is True
+        assert plugin_status["parser"] is True
 
-    def test_graph_parse(self, tmp_path, sample_turtle_doc):
+    def test_graph_parse(self, sample_turtle_file):
         """Test parsing via Graph.parse()."""
-        file_path = tmp_path / "test.md"
-        file_path.write_text(sample_turtle_doc)
+        file_path = sample_turtle_file
 
         graph = Graph()
         graph.parse(str(file_path), format="yurtle")
@@ -115,34 +292,105 @@ class TestYurtleRDFlibParser:
         assert len(graph) >= 4
 
         # Verify subject exists
-        subjects = list(graph.subjects())
-        assert URIRef("urn:task:T-001") in subjects
+        assert (TASK_T001, None, None) in graph
+
+    def test_graph_parse_twice(self, sample_turtle_file):
+        """Test that parsing into a non-empty graph skips known triples."""
+        file_path = sample_turtle_file
+
+        graph = Graph()
+        graph.parse(str(file_path), format="yurtle")
+        first = set(graph)
+        graph.parse(str(file_path), format="yurtle")
+
+        assert set(graph) == first
+
+    def test_parse_many(self, tmp_path, sample_turtle_doc, sample_yaml_doc):
+        """Test that parse_many matches parsing each file in turn."""
+        from yurtle_rdflib.parser import YurtleRDFlibParser
+
+        paths = []
+        for i, text in enumerate([sample_turtle_doc, sample_yaml_doc, "# No frontmatter\n"]):
+            file_path = tmp_path / f"doc{i}.md"
+            file_path.write_text(text)
+            paths.append(str(file_path))
+
+        expected = Graph()
+        for path in paths:
+            expected.parse(path, format="yurtle")
+
+        graph = Graph()
+        YurtleRDFlibParser().parse_many(paths, graph)
 
-    def test_provenance_added(self, tmp_path, sample_turtle_doc):
+        assert set(graph) == set(expected)
+
+    def test_parse_many_follows_repointed_symlink(self, tmp_path, sample_turtle_doc):
+        """Test that a parse_many batch resolves a directory symlink re-pointed since the last."""
+        from yurtle_rdflib.namespaces import PROVENANCE
+        from yurtle_rdflib.parser import YurtleRDFlibParser
+
+        for name in ("old", "new"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "task.md").write_text(sample_turtle_doc)
+        link = tmp_path / "current"
+        link.symlink_to(tmp_path / "old")
+        YurtleRDFlibParser().parse_many([str(link / "task.md")], Graph())
+
+        link.unlink()
+        link.symlink_to(tmp_path / "new")
+        graph = Graph()
+        YurtleRDFlibParser().parse_many([str(link / "task.md")], graph)
+
+        expected = URIRef(f"file://{(tmp_path / 'new' / 'task.md').resolve()}")
+        assert set(graph.objects(None, PROVENANCE.definedIn)) == {expected}
+
+    def test_provenance_added(self, sample_turtle_file):
         """Test that provenance triples are added."""
-        file_path = tmp_path / "test.md"
-        file_path.write_text(sample_turtle_doc)
+        file_path = sample_turtle_file
 
         graph = Graph()
         graph.parse(str(file_path), format="yurtle", provenance=True)
 
         # Check for definedIn triple
         from yurtle_rdflib.namespaces import PROVENANCE
-        defined_in_triples = list(graph.triples((None, PROVENANCE.definedIn, None)))
-        assert len(defined_in_triples) >= 1
+        assert (None, PROVENANCE.definedIn, None) in graph
+
+    def test_provenance_resolves_symlinks(self, tmp_path, sample_turtle_doc):
+        """Test that provenance URIs match Path.resolve() through symlinks."""
+        real_dir = tmp_path / "real"
+        real_dir.mkdir()
+        (real_dir / "test.md").write_text(sample_turtle_doc)
+        (tmp_path / "linked").symlink_to(real_dir)
+        (real_dir / "alias.md").symlink_to(real_dir / "test.md")
+
+        from yurtle_rdflib.namespaces import PROVENANCE
+        for file_path in [tmp_path / "linked" / "test.md", real_dir / "alias.md"]:
+            graph = Graph()
+            graph.parse(str(file_path), format="yurtle")
 
-    def test_no_provenance_when_disabled(self, tmp_path, sample_turtle_doc):
+            file_uris = set(graph.objects(None, PROVENANCE.definedIn))
+            assert file_uris == {URIRef(f"file://{file_path.resolve()}")}
+
+    def test_no_provenance_when_disabled(self, sample_turtle_file):
         """Test that provenance can be disabled."""
-        file_path = tmp_path / "test.md"
-        file_path.write_text(sample_turtle_doc)
+        file_path = sample_turtle_file
 
         graph = Graph()
         graph.parse(str(file_path), format="yurtle", provenance=False)
 
         # Should not have definedIn triples
         from yurtle_rdflib.namespaces import PROVENANCE
-        defined_in_triples = list(graph.triples((None, PROVENANCE.definedIn, None)))
-        assert len(defined_in_triples) == 0
+        assert (None, PROVENANCE.definedIn, None) not in graph
+
+    def test_subject_from_path_without_provenance(self, tmp_path):
+        """Test that documents without a subject are named after the file."""
+        file_path = tmp_path / "note-1.md"
+        file_path.write_text("---\ntitle: Note\n---\n\n# Note\n")
+
+        graph = Graph()
+        graph.parse(str(file_path), format="yurtle", provenance=False)
+
+        assert set(graph.subjects()) == {URIRef("urn:doc:note-1")}
 
 
 class TestConvenienceFunctions:
@@ -155,19 +403,17 @@ class TestConvenienceFunctions:
         assert doc.frontmatter_type == "turtle"
         assert doc.subject_uri is not None
 
-    def test_parse_yurtle_file(self, tmp_path, sample_turtle_doc):
+    def test_parse_yurtle_file(self, sample_turtle_file):
         """Test parse_yurtle_file function."""
-        file_path = tmp_path / "test.md"
-        file_path.write_text(sample_turtle_doc)
+        file_path = sample_turtle_file
 
         doc = yurtle_rdflib.parse_yurtle_file(file_path)
 
         assert doc.source_path == file_path
 
-    def test_parse_file(self, tmp_path, sample_turtle_doc):
+    def test_parse_file(self, sample_turtle_file):
         """Test parse_file function."""
-        file_path = tmp_path / "test.md"
-        file_path.write_text(sample_turtle_doc)
+        file_path = sample_turtle_file
 
         graph = yurtle_rdflib.parse_file(file_path)
 
@@ -5,11 +5,21 @@ Tests for the YurtleStore.
 import pytest
 from pathlib import Path
 from rdflib import Graph, URIRef, Literal
+from rdflib.plugins.sparql import prepareQuery
 
 import yurtle_rdflib
 from yurtle_rdflib import YurtleStore, YURTLE, PM
 from yurtle_rdflib.namespaces import PROVENANCE
 
+TASK1 = URIRef("urn:task:task1")
+
+# Parsed once for the module rather than on every query
+TITLE_QUERY = prepareQuery("""
+    SELECT ?s ?title WHERE {
+        ?s <https://yurtle.dev/schema/title> ?title .
+    }
+""")
+
 
 class TestYurtleStoreInit:
     """Tests for YurtleStore initialization."""
@@ -44,6 +54,51 @@ class TestYurtleStoreInit:
 
         assert len(store.file_states) == 1
 
+    def test_backend(self, temp_workspace):
+        """Test holding the in-memory graph in another rdflib store."""
+        from rdflib.plugins.stores.memory import SimpleMemory
+
+        store = YurtleStore(str(temp_workspace), backend="SimpleMemory")
+        default = YurtleStore(str(temp_workspace))
+
+        assert isinstance(store.internal_graph.store, SimpleMemory)
+        assert set(store.internal_graph) == set(default.internal_graph)
+
+    def test_index_round_trip(self, temp_workspace):
+        """Test that a new store reloads file states from the saved index."""
+        store = YurtleStore(str(temp_workspace))
+        reloaded = YurtleStore(str(temp_workspace))
+
+        assert reloaded.file_states.keys() == store.file_states.keys()
+        for path, state in store.file_states.items():
+            assert reloaded.file_states[path].hash == state.hash
+            assert reloaded.file_states[path].subject_uri == state.subject_uri
+        assert set(reloaded.internal_graph) == set(store.internal_graph)
+
+    def test_index_format(self, temp_workspace):
+        """Test that the index records its format version and an epoch timestamp."""
+        import json
+
+        YurtleStore(str(temp_workspace))
+        data = json.loads((temp_workspace / ".yurtle-store-index.json").read_text())
+
+        assert data["version"] == YurtleStore.INDEX_VERSION == "2.0"
+        assert isinstance(data["updated"], float)
+
+    def test_index_omits_markdown(self, temp_workspace):
+        """Test that markdown bodies stay out of the index but survive flushes."""
+        YurtleStore(str(temp_workspace))
+        index = (temp_workspace / ".yurtle-store-index.json").read_text()
+        assert "First task." not in index
+
+        reloaded = YurtleStore(str(temp_workspace))
+        reloaded.add((TASK1, YURTLE.note, Literal("A note")))
+        reloaded.flush()
+
+        text = (temp_workspace / "task1.md").read_text()
+        assert "A note" in text
+        assert "First task." in text
+
 
 class TestYurtleStoreSync:
     """Tests for YurtleStore synchronization."""
@@ -67,17 +122,22 @@ class TestYurtleStoreSync:
         assert len(store.file_states) == initial_count + 1
 
     def test_sync_detects_modified_files(self, temp_workspace):
-        """Test that sync detects modified files."""
+        """Test that sync detects modified files, re-reading only those."""
+        import mmap
+
         store = YurtleStore(str(temp_workspace))
 
-        # Modify existing file
+        # Modify existing file in place; the size and inode stay the same
         task1_path = temp_workspace / "task1.md"
-        original = task1_path.read_text()
-        task1_path.write_text(original.replace("Task One", "Modified Task"))
+        with open(task1_path, "r+b") as f, mmap.mmap(f.fileno(), 0) as mm:
+            start = mm.find(b"Task One")
+            mm[start:start + len(b"Task Uno")] = b"Task Uno"
 
         synced = store.sync()
 
-        assert synced >= 1
+        assert synced == 1
+        titles = set(store.internal_graph.objects(TASK1, YURTLE.title))
+        assert titles == {Literal("Task Uno")}
 
     def test_sync_detects_deleted_files(self, temp_workspace):
         """Test that sync detects deleted files."""
@@ -92,39 +152,111 @@ class TestYurtleStoreSync:
         assert synced >= 1
         assert len(store.file_states) == initial_count - 1
 
+    def test_sync_skips_unchanged_stat(self, temp_workspace, monkeypatch):
+        """Test that files whose stat matches the index are not hashed."""
+        import os
+
+        task1_path = temp_workspace / "task1.md"
+        os.utime(task1_path, ns=(10**18, 10**18))
+        store = YurtleStore(str(temp_workspace))
+
+        hashed = []
+        read = store._read_if_changed
+        monkeypatch.setattr(store, "_read_if_changed", lambda c: hashed.append(c[0]) or read(c))
+
+        store.sync()
+        assert task1_path not in hashed
+
+        # A new mtime sends the file back through hashing
+        task1_path.write_text(task1_path.read_text().replace("Task One", "Task Two"))
+        os.utime(task1_path, ns=(10**18, 10**18 + 1))
+        assert store.sync() >= 1
+        assert task1_path in hashed
+
+    def test_parallel_sync_matches_serial(self, tmp_path, sample_turtle_doc, monkeypatch):
+        """Test that syncing many files in a thread pool matches a serial sync."""
+        for i in range(10):
+            text = sample_turtle_doc.replace("T-001", f"T-{i:03d}")
+            (tmp_path / f"task{i}.md").write_text(text)
+        (tmp_path / "broken.md").write_text("---\n<urn:broken> <oops\n---\n")
+
+        parallel = YurtleStore(str(tmp_path))
+        (tmp_path / ".yurtle-store-index.json").unlink()
+        monkeypatch.setattr(YurtleStore, "PARALLEL_SYNC_THRESHOLD", 1000)
+        serial = YurtleStore(str(tmp_path))
+
+        assert set(parallel.internal_graph) == set(serial.internal_graph)
+        assert parallel.file_states.keys() == serial.file_states.keys()
+
+    def test_file_hash(self, tmp_path):
+        """Test that file hashes track content, including empty files."""
+        store = YurtleStore(str(tmp_path))
+        path = tmp_path / "doc.md"
+
+        path.write_bytes(b"")
+        empty = store._compute_file_hash(path)
+        path.write_bytes(b"# Doc\n")
+        first = store._compute_file_hash(path)
+
+        assert empty and first and empty != first
+        assert store._compute_file_hash(path) == first
+
+        # Files spanning several read blocks hash like one update
+        from yurtle_rdflib.store import _file_hasher
+
+        data = bytes(range(256)) * (YurtleStore.HASH_BLOCK_SIZE // 128 + 3)
+        path.write_bytes(data)
+        hasher = _file_hasher()
+        hasher.update(data)
+        assert store._compute_file_hash(path) == hasher.hexdigest()
+
+    def test_sync_follows_repointed_symlink(self, tmp_path, sample_turtle_doc):
+        """Test that a store opened after a directory symlink moves uses the new target."""
+        for name in ("old", "new"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "task.md").write_text(sample_turtle_doc)
+        link = tmp_path / "current"
+        link.symlink_to(tmp_path / "old")
+        YurtleStore(str(link))
+
+        link.unlink()
+        link.symlink_to(tmp_path / "new")
+        store = YurtleStore(str(link))
+
+        expected = URIRef(f"file://{(tmp_path / 'new' / 'task.md').resolve()}")
+        assert set(store.internal_graph.objects(None, PROVENANCE.definedIn)) == {expected}
+
 
 class TestYurtleStoreQuery:
     """Tests for querying the store."""
 
-    def test_triples(self, temp_workspace):
+    def test_triples(self, session_yurtle_store):
         """Test iterating over triples."""
-        store = YurtleStore(str(temp_workspace))
+        store = session_yurtle_store
 
-        triples = list(store.triples((None, None, None)))
-        assert len(triples) > 0
+        assert next(store.triples((None, None, None)), None) is not None
 
-    def test_triples_with_pattern(self, temp_workspace):
+    def test_triples_with_pattern(self, session_yurtle_store):
         """Test filtering triples with pattern."""
-        store = YurtleStore(str(temp_workspace))
+        store = session_yurtle_store
 
         # Get all title triples
-        title_triples = list(store.triples((None, YURTLE.title, None)))
-        assert len(title_triples) >= 2  # task1 and task2
+        title_count = sum(1 for _ in store.triples((None, YURTLE.title, None)))
+        assert title_count >= 2  # task1 and task2
 
-    def test_len(self, temp_workspace):
+    def test_len(self, session_yurtle_store):
         """Test __len__ method."""
-        store = YurtleStore(str(temp_workspace))
+        store = session_yurtle_store
 
         assert len(store) > 0
 
-    def test_contains(self, temp_workspace):
+    def test_contains(self, session_yurtle_store):
         """Test __contains__ method."""
-        store = YurtleStore(str(temp_workspace))
+        store = session_yurtle_store
 
         # Get a triple that should exist
-        for triple, _ in store.triples((None, YURTLE.title, None)):
-            assert triple in store
-            break
+        triple, _ = next(store.triples((None, YURTLE.title, None)))
+        assert triple in store
 
 
 class TestYurtleStoreModification:
@@ -135,25 +267,30 @@ class TestYurtleStoreModification:
         store = YurtleStore(str(temp_workspace))
         initial_len = len(store)
 
-        subject = URIRef("urn:task:task1")
+        subject = TASK1
         store.add((subject, YURTLE.note, Literal("A note")))
 
         assert len(store) == initial_len + 1
         assert (subject, YURTLE.note, Literal("A note")) in store
 
+    def test_subject_file_resolution(self, temp_workspace):
+        """Test that subjects resolve to their file until provenance is removed."""
+        store = YurtleStore(str(temp_workspace))
+        subject = TASK1
+
+        assert store.get_file_for_subject(subject) in store.file_states
+        store.remove((subject, PROVENANCE.definedIn, None))
+        assert store.get_file_for_subject(subject) is None
+
     def test_remove_triple(self, temp_workspace):
         """Test removing a triple."""
         store = YurtleStore(str(temp_workspace))
 
         # Get a triple to remove
-        triple = None
-        for t, _ in store.triples((None, YURTLE.title, None)):
-            triple = t
-            break
+        triple, _ = next(store.triples((None, YURTLE.title, None)))
 
-        if triple:
-            store.remove(triple)
-            assert triple not in store
+        store.remove(triple)
+        assert triple not in store
 
 
 class TestYurtleStoreFlush:
@@ -164,7 +301,7 @@ class TestYurtleStoreFlush:
         store = YurtleStore(str(temp_workspace), auto_flush=False)
 
         # Make a change
-        subject = URIRef("urn:task:task1")
+        subject = TASK1
         store.add((subject, YURTLE.note, Literal("New note")))
 
         # Should have dirty files
@@ -181,38 +318,123 @@ class TestYurtleStoreFlush:
         store = YurtleStore(str(temp_workspace), auto_flush=True)
 
         # Make a change - should auto-flush
-        subject = URIRef("urn:task:task1")
+        subject = TASK1
         store.add((subject, YURTLE.note, Literal("Auto-flushed note")))
 
         # Should have no dirty files (already flushed)
         # Note: this depends on the subject already having provenance
         # In practice, new subjects without provenance won't auto-flush
 
+    def test_flush_reuses_frontmatter(self, temp_workspace, monkeypatch):
+        """Test that re-flushing an unchanged subject skips Turtle serialization."""
+        store = YurtleStore(str(temp_workspace))
+        subject = TASK1
+        store.add((subject, YURTLE.note, Literal("A note")))
+        store.flush()
+        first = (temp_workspace / "task1.md").read_text()
+
+        serialized = []
+        serialize = store.writer._serialize_turtle_bytes
+        monkeypatch.setattr(store.writer, "_serialize_turtle_bytes", lambda g: serialized.append(g) or serialize(g))
+
+        store.add((subject, YURTLE.note, Literal("A note")))
+        store.flush()
+        assert serialized == []
+        assert (temp_workspace / "task1.md").read_text() == first
+
+        store.add((subject, YURTLE.note, Literal("Another note")))
+        store.flush()
+        assert len(serialized) == 1
+        assert "Another note" in (temp_workspace / "task1.md").read_text()
+
+    def test_auto_flush_batch(self, temp_workspace):
+        """Test that a batch of added triples rewrites each file once."""
+        store = YurtleStore(str(temp_workspace), auto_flush=True)
+        graph = Graph(store=store)
+
+        written = []
+        write_file = store.writer.write_file
+        store.writer.write_file = lambda doc, path, **kw: written.append(path) or write_file(doc, path, **kw)
+
+        subject = TASK1
+        graph.addN((subject, YURTLE.note, Literal(f"Note {i}"), graph) for i in range(5))
+
+        assert written == [temp_workspace / "task1.md"]
+        assert 'Note 4' in (temp_workspace / "task1.md").read_text()
+
 
 class TestYurtleStoreGraph:
     """Tests for using store with RDFlib Graph."""
 
-    def test_graph_with_store(self, temp_workspace):
+    def test_graph_with_store(self, session_yurtle_store):
         """Test creating a Graph with YurtleStore."""
-        store = YurtleStore(str(temp_workspace))
+        store = session_yurtle_store
         graph = Graph(store=store)
 
         assert len(graph) > 0
 
-    def test_graph_query(self, temp_workspace):
+    def test_graph_query(self, session_yurtle_store):
         """Test SPARQL query on store-backed graph."""
-        store = YurtleStore(str(temp_workspace))
+        store = session_yurtle_store
 
         # Query directly on the internal graph instead
         # (Custom stores may not support all query parameters)
-        results = list(store.internal_graph.query("""
-            SELECT ?s ?title WHERE {
-                ?s <https://yurtle.dev/schema/title> ?title .
-            }
-        """))
+        results = list(store.internal_graph.query(TITLE_QUERY))
 
         assert len(results) >= 2
 
+    def test_query_skips_sync_while_watching(self, temp_workspace, monkeypatch):
+        """Test that a watching store only syncs on query after a file event."""
+        from types import SimpleNamespace
+
+        store = YurtleStore(str(temp_workspace))
+        monkeypatch.setattr(store, "_observer", object())  # Stand-in for a running watcher
+        synced = []
+        monkeypatch.setattr(store, "sync", lambda: synced.append(True))
+        query = "SELECT ?s WHERE { ?s <https://yurtle.dev/schema/title> ?t }"
+
+        store._fs_changed = False
+        store.query(query)
+        assert synced == []
+
+        index_event = SimpleNamespace(
+            event_type="modified", is_directory=False, src_path=str(store._index_path)
+        )
+        store._mark_stale(index_event)
+        store.query(query)
+        assert synced == []
+
+        file_event = SimpleNamespace(
+            event_type="modified", is_directory=False, src_path=str(temp_workspace / "task1.md")
+        )
+        store._mark_stale(file_event)
+        assert len(store.query(query)) >= 2
+        assert synced == [True]
+
+    def test_graph_triples_choices(self, temp_workspace):
+        """Test pattern lookups with a list of predicate choices."""
+        store = YurtleStore(str(temp_workspace))
+        graph = Graph(store=store)
+
+        found = set(graph.triples_choices((None, [YURTLE.title, PM.status], None)))
+        expected = set(graph.triples((None, YURTLE.title, None))) | set(graph.triples((None, PM.status, None)))
+        assert found == expected and found
+
+    def test_graph_bind(self, temp_workspace):
+        """Test that prefixes bound on the graph reach flushed files, even after a flush."""
+        store = YurtleStore(str(temp_workspace))
+        graph = Graph(store=store)
+        ex = "https://example.org/ns/"
+        graph.add((TASK1, YURTLE.note, Literal("Before binding")))
+        store.flush()
+
+        graph.bind("ex", ex)
+        graph.add((TASK1, URIRef(ex + "note"), Literal("Bound")))
+        store.flush()
+
+        assert graph.namespace_manager.store.namespace("ex") == URIRef(ex)
+        assert "ex:note" in (temp_workspace / "task1.md").read_text()
+
 
 class TestConvenienceFunctions:
     """Tests for convenience store functions."""
@@ -233,9 +455,9 @@ class TestConvenienceFunctions:
         assert isinstance(graph, Graph)
         assert len(graph) > 0
 
-    def test_get_stats(self, temp_workspace):
+    def test_get_stats(self, session_yurtle_store):
         """Test get_stats method."""
-        store = YurtleStore(str(temp_workspace))
+        store = session_yurtle_store
         stats = store.get_stats()
 
         assert "root_dir" in stats
@@ -10,22 +10,29 @@ import yurtle_rdflib
 from yurtle_rdflib import YURTLE, PM
 from yurtle_rdflib.namespaces import PROVENANCE
 
+TASK1 = URIRef("urn:task:task1")
+
+
+def _failing_chunk(paths):
+    """Stand-in for core._parse_chunk whose worker task fails outright."""
+    raise ValueError("worker failed")
+
 
 class TestLoadWorkspace:
     """Tests for load_workspace function."""
 
-    def test_load_workspace(self, temp_workspace):
+    def test_load_workspace(self, session_temp_workspace):
         """Test loading a workspace."""
-        graph = yurtle_rdflib.load_workspace(str(temp_workspace))
+        graph = yurtle_rdflib.load_workspace(str(session_temp_workspace))
 
         assert isinstance(graph, Graph)
         assert len(graph) > 0
 
-    def test_load_workspace_with_patterns(self, temp_workspace):
+    def test_load_workspace_with_patterns(self, session_temp_workspace):
         """Test loading with specific patterns."""
         # Only load top-level files
         graph = yurtle_rdflib.load_workspace(
-            str(temp_workspace),
+            str(session_temp_workspace),
             patterns=["*.md"]
         )
 
@@ -34,13 +41,109 @@ class TestLoadWorkspace:
         assert "Task One" in titles
         assert "Task Two" in titles
 
-    def test_load_workspace_provenance(self, temp_workspace):
+    def test_load_workspace_provenance(self, session_temp_workspace):
         """Test that provenance triples are added."""
-        graph = yurtle_rdflib.load_workspace(str(temp_workspace))
+        graph = yurtle_rdflib.load_workspace(str(session_temp_workspace))
 
         # Should have definedIn triples
-        provenance_triples = list(graph.triples((None, PROVENANCE.definedIn, None)))
-        assert len(provenance_triples) >= 2
+        provenance_count = sum(1 for _ in graph.triples((None, PROVENANCE.definedIn, None)))
+        assert provenance_count >= 2
+
+    def test_load_workspace_parallel(self, session_temp_workspace):
+        """Test that parallel parsing yields the same graph as serial parsing."""
+        serial = yurtle_rdflib.load_workspace(str(session_temp_workspace), max_workers=1)
+        parallel = yurtle_rdflib.load_workspace(str(session_temp_workspace), max_workers=2)
+
+        assert set(parallel) == set(serial)
+
+    def test_load_workspace_parallel_chunks(self, temp_workspace, sample_turtle_doc, monkeypatch):
+        """Test that files parsed in chunks match serial parsing, skipping failed files."""
+        import yurtle_rdflib.core
+
+        for i in range(4):
+            (temp_workspace / f"extra{i}.md").write_text(sample_turtle_doc.replace("T-001", f"T-10{i}"))
+        (temp_workspace / "bad.md").write_bytes(b"---\nid: \xff\n---\n")
+        monkeypatch.setattr(yurtle_rdflib.core, "PARALLEL_CHUNKS_PER_WORKER", 1)
+
+        serial = yurtle_rdflib.load_workspace(str(temp_workspace), max_workers=1)
+        parallel = yurtle_rdflib.load_workspace(str(temp_workspace), max_workers=2)
+
+        assert set(parallel) == set(serial)
+        assert URIRef("urn:task:T-103") in set(parallel.subjects())
+
+    def test_load_workspace_parallel_spawn(self, tmp_path, sample_turtle_doc, caplog, monkeypatch):
+        """Test that a large workspace loads in full with a non-fork start method."""
+        import multiprocessing
+        import os
+
+        # Use the pool even on a single-CPU host
+        monkeypatch.setattr(os, "cpu_count", lambda: 2)
+
+        for i in range(70):
+            (tmp_path / f"task{i}.md").write_text(sample_turtle_doc.replace("T-001", f"T-{i:03d}"))
+        serial = yurtle_rdflib.load_workspace(str(tmp_path))
+
+        method = multiprocessing.get_start_method(allow_none=True)
+        multiprocessing.set_start_method("spawn", force=True)
+        try:
+            parallel = yurtle_rdflib.load_workspace(str(tmp_path), max_workers=2)
+        finally:
+            multiprocessing.set_start_method(method, force=True)
+
+        assert len(serial) == 70 * 5  # four triples and provenance per file
+        assert set(parallel) == set(serial)
+        assert "Process pool failed" not in caplog.text
+
+    def test_load_workspace_failed_chunk(self, temp_workspace, sample_turtle_doc, monkeypatch):
+        """Test that files in a chunk whose worker task fails are parsed in-process."""
+        import os
+        import yurtle_rdflib.core
+
+        for i in range(4):
+            (temp_workspace / f"extra{i}.md").write_text(sample_turtle_doc.replace("T-001", f"T-10{i}"))
+        expected = set(yurtle_rdflib.load_workspace(str(temp_workspace)))
+        monkeypatch.setattr(os, "cpu_count", lambda: 2)
+        monkeypatch.setattr(yurtle_rdflib.core, "_parse_chunk", _failing_chunk)
+
+        assert set(yurtle_rdflib.load_workspace(str(temp_workspace), max_workers=2)) == expected
+
+    def test_load_workspace_serial_by_default(self, temp_workspace, monkeypatch):
+        """Test that no process pool starts by default or on a single CPU."""
+        import yurtle_rdflib.core
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool started")
+
+        monkeypatch.setattr(yurtle_rdflib.core, "ProcessPoolExecutor", no_pool)
+        expected = len(yurtle_rdflib.load_workspace(str(temp_workspace)))
+        monkeypatch.setattr(yurtle_rdflib.core.os, "cpu_count", lambda: 1)
+
+        assert len(yurtle_rdflib.load_workspace(str(temp_workspace), max_workers=4)) == expected
+
+    def test_load_workspace_skips_plain_markdown(self, temp_workspace):
+        """Test that files without frontmatter add nothing to the graph."""
+        before = set(yurtle_rdflib.load_workspace(str(temp_workspace)))
+        (temp_workspace / "notes.md").write_text("# Notes\n\nJust prose.\n")
+
+        after = set(yurtle_rdflib.load_workspace(str(temp_workspace)))
+
+        assert after == before
+
+    def test_load_follows_repointed_symlink(self, tmp_path, sample_turtle_doc):
+        """Test that provenance follows a directory symlink re-pointed between loads."""
+        for name in ("old", "new"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "task.md").write_text(sample_turtle_doc)
+        link = tmp_path / "current"
+        link.symlink_to(tmp_path / "old")
+        yurtle_rdflib.load_workspace(str(link))
+
+        link.unlink()
+        link.symlink_to(tmp_path / "new")
+        graph = yurtle_rdflib.load_workspace(str(link))
+
+        expected = URIRef(f"file://{(tmp_path / 'new' / 'task.md').resolve()}")
+        assert set(graph.objects(None, PROVENANCE.definedIn)) == {expected}
 
     def test_load_empty_workspace(self, tmp_path):
         """Test loading an empty workspace."""
@@ -61,7 +164,7 @@ class TestSaveWorkspace:
         graph = yurtle_rdflib.load_workspace(str(temp_workspace))
 
         # Modify
-        subject = URIRef("urn:task:task1")
+        subject = TASK1
         graph.add((subject, YURTLE.note, Literal("Added note")))
 
         # Save to new location
@@ -86,27 +189,121 @@ class TestSaveWorkspace:
         task1_content = (temp_workspace / "task1.md").read_text()
         assert "# Task One" in task1_content
 
+    def test_save_reuses_loaded_markdown(self, temp_workspace):
+        """Test that markdown captured at load time is written back."""
+        graph = yurtle_rdflib.load_workspace(str(temp_workspace))
+
+        # Remove the file so its markdown can only come from the load
+        (temp_workspace / "task1.md").unlink()
+        yurtle_rdflib.save_workspace(graph, str(temp_workspace))
+
+        task1_content = (temp_workspace / "task1.md").read_text()
+        assert "# Task One" in task1_content
+
+    def test_save_rereads_edited_markdown(self, temp_workspace, monkeypatch):
+        """Test that a body edited after load is kept, and an unchanged one reused."""
+        import os
+
+        task1_path = temp_workspace / "task1.md"
+        task2_path = temp_workspace / "task2.md"
+        for path in (task1_path, task2_path):
+            os.utime(path, ns=(10**18, 10**18))
+        graph = yurtle_rdflib.load_workspace(str(temp_workspace))
+
+        task1_path.write_text(task1_path.read_text().replace("First task.", "Edited body."))
+        read = []
+        extract = yurtle_rdflib._extract_markdown
+        monkeypatch.setattr(yurtle_rdflib, "_extract_markdown", lambda p: read.append(p) or extract(p))
+        yurtle_rdflib.save_workspace(graph, str(temp_workspace))
+
+        assert "Edited body." in task1_path.read_text()
+        assert task2_path not in read
+        assert "# Task Two" in task2_path.read_text()
+
+    def test_save_thread_pool_sizing(self, temp_workspace, monkeypatch):
+        """Test that one file is written directly and the pool is sized to the files."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        sizes = []
+
+        def recording_pool(max_workers):
+            sizes.append(max_workers)
+            return ThreadPoolExecutor(max_workers=max_workers)
+
+        monkeypatch.setattr(yurtle_rdflib, "ThreadPoolExecutor", recording_pool)
+        graph = yurtle_rdflib.load_workspace(str(temp_workspace))
+        assert yurtle_rdflib.save_workspace(graph, str(temp_workspace)) == 3
+        single = yurtle_rdflib.load_workspace(str(temp_workspace), patterns=["task1.md"])
+        assert yurtle_rdflib.save_workspace(single, str(temp_workspace)) == 1
+
+        assert sizes == [3]
+
 
 class TestScanWorkspaceGraph:
     """Tests for scan_workspace_graph function."""
 
-    def test_scan_workspace_graph(self, temp_workspace):
+    def test_scan_workspace_graph(self, session_temp_workspace):
         """Test scanning a workspace."""
-        graph = yurtle_rdflib.scan_workspace_graph(temp_workspace)
+        graph = yurtle_rdflib.scan_workspace_graph(session_temp_workspace)
 
         assert isinstance(graph, Graph)
         assert len(graph) > 0
 
-    def test_scan_with_patterns(self, temp_workspace):
+    def test_scan_with_patterns(self, session_temp_workspace):
         """Test scanning with specific patterns."""
         # Only scan top-level
         graph = yurtle_rdflib.scan_workspace_graph(
-            temp_workspace,
+            session_temp_workspace,
             patterns=["*.md"]
         )
 
         assert len(graph) > 0
 
+    def test_scan_patterns_match_glob(self, temp_workspace):
+        """Test that scandir-served patterns find the same files as Path.glob."""
+        from yurtle_rdflib.core import _collect_workspace_files
+
+        for name in ("a", "b", "c"):
+            (temp_workspace / name / "deep").mkdir(parents=True)
+            (temp_workspace / name / "doc.md").write_text("---\n")
+            (temp_workspace / name / "deep" / "doc.md").write_text("---\n")
+
+        for pattern in ["*.md", "*/*.md", "**/*.md", "*/**/*.md", "[ab]/*.md"]:
+            expected = sorted(
+                path for path in temp_workspace.glob(pattern)
+                if path.is_file() and not path.name.startswith(".")
+            )
+            assert sorted(_collect_workspace_files(temp_workspace, [pattern])) == expected
+
+        # Patterns sharing a walk are matched together, without duplicates
+        (temp_workspace / "a" / "notes.markdown").write_text("---\n")
+        patterns = ["**/*.md", "**/*.markdown", "**/doc.*"]
+        expected = sorted({
+            path for pattern in patterns for path in temp_workspace.glob(pattern)
+            if path.is_file() and not path.name.startswith(".")
+        })
+        assert sorted(_collect_workspace_files(temp_workspace, patterns)) == expected
+
+    def test_scan_reports_new_triples(self, tmp_path, sample_turtle_doc, caplog):
+        """Test that triples repeated across files are reported once."""
+        import logging
+
+        (tmp_path / "a.md").write_text(sample_turtle_doc)
+        (tmp_path / "b.md").write_text(sample_turtle_doc)
+        with caplog.at_level(logging.INFO, logger="yurtle_rdflib.core"):
+            graph = yurtle_rdflib.scan_workspace_graph(tmp_path)
+
+        # The four triples both files define are added once
+        assert len(graph) == 4
+        assert "Scanned 2 files, extracted 4 triples" in caplog.text
+
+    def test_scan_parallel(self, session_temp_workspace):
+        """Test scanning with worker processes."""
+        serial = yurtle_rdflib.scan_workspace_graph(session_temp_workspace, max_workers=1)
+        parallel = yurtle_rdflib.scan_workspace_graph(session_temp_workspace, max_workers=2)
+
+        assert set(parallel) == set(serial)
+
 
 class TestNamespaces:
     """Tests for namespace handling."""